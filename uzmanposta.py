@@ -14,28 +14,140 @@ Reference: https://mxlayer.stoplight.io/
 # pylint: disable=too-many-lines
 
 import os
+import re
 import sys
 import json
 import socket
 import configparser
 import logging
 import hashlib
+import heapq
+import math
+import random
 import signal
 import time
 import threading
+import functools
+import gzip
+import queue
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from urllib.parse import urlparse
-from typing import Optional, List, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse, urlencode
+from typing import Optional, List, Dict, Any, Tuple, BinaryIO, ClassVar, Set
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import requests  # pylint: disable=import-error
+from requests.adapters import HTTPAdapter  # pylint: disable=import-error
+from urllib3.util.retry import Retry  # pylint: disable=import-error
 
 if os.name == 'nt':
     import msvcrt # pylint: disable=import-error
 else:
     import fcntl # pylint: disable=import-error
 
+# Optional: orjson is a much faster JSON codec; fall back to stdlib json if missing
+try:
+    import orjson # pylint: disable=import-error
+except ImportError:
+    orjson = None
+
+# Optional: xxhash is a fast non-cryptographic hash for cache keys; blake2b otherwise
+try:
+    import xxhash # pylint: disable=import-error
+except ImportError:
+    xxhash = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON document from bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when available.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation instead of compact output
+
+    Returns:
+        Encoded JSON document (non-ASCII characters are kept as UTF-8)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _interruptible_sleep(seconds: float) -> None:
+    """
+    Sleeps for the given time, returning early once shutdown has been requested.
+
+    Short sleeps are a single time.sleep; longer ones are split into one-second
+    slices so a shutdown signal is noticed promptly.
+
+    Args:
+        seconds: Time to sleep in seconds
+    """
+    if seconds <= 1.0:
+        time.sleep(seconds)
+        return
+    deadline = time.monotonic() + seconds
+    while not MailLogger._shutdown_flag:  # pylint: disable=protected-access
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, 1.0))
+
+
+# (Unix second, formatted local time) last returned by _console_timestamp
+_console_ts_cache: Tuple[int, str] = (0, '')
+
+
+def _console_timestamp() -> str:
+    """Returns the current local time as 'YYYY-MM-DD HH:MM:SS', formatted once per second."""
+    global _console_ts_cache  # pylint: disable=global-statement
+    now = int(time.time())
+    cached = _console_ts_cache
+    if cached[0] != now:
+        cached = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+        # Replaced as one tuple, so concurrent callers never see a mixed pair
+        _console_ts_cache = cached
+    return cached[1]
+
+
+# Connection error classification patterns, matched case-insensitively against str(error)
+_TIMEOUT_PATTERN = re.compile(r'timeout|timed out', re.IGNORECASE)
+_REFUSED_PATTERN = re.compile(
+    r'connection refused|\[errno 111\]|\[winerror 10061\]', re.IGNORECASE)
+_SSL_PATTERN = re.compile(r'ssl|certificate', re.IGNORECASE)
+
+
+def _hash_key(data: bytes) -> str:
+    """Hash bytes to a short hex string for use as a cache key (not for security)."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+# Directories already created by this process (shared by all sections/threads)
+_ensured_dirs: Set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) once per process; later calls are no-ops."""
+    with _ensured_dirs_lock:
+        if path in _ensured_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
 
 @dataclass
 class MailLoggerConfig: # pylint: disable=too-many-instance-attributes
@@ -61,11 +173,12 @@ class MailLoggerConfig: # pylint: disable=too-many-instance-attributes
     message_log_retention_count: int = 2
     error_log_file_name: str = 'errors_%Y-%m-%d_%H.log'
     error_log_retention_count: int = 2
+    log_max_bytes: int = 10 * 1024 * 1024
     list_timeout: int = 300
     detail_timeout: int = 120
-    list_retries: int = 10
+    list_retries: int = 8
     list_sleep_time: int = 2
-    detail_retries: int = 10
+    detail_retries: int = 8
     detail_sleep_time: int = 2
     max_records_per_page: int = 1000
     heartbeat_file: str = 'heartbeat.json'
@@ -73,6 +186,9 @@ class MailLoggerConfig: # pylint: disable=too-many-instance-attributes
     section_name: str = ''
     max_parallel_details: int = 2
     use_session: bool = True
+    enable_etag_cache: bool = False
+    collect_metrics: bool = True
+    max_in_flight_requests: int = 16
 
 
 
@@ -86,13 +202,65 @@ class Metrics:
     min_api_time: float = float('inf')
     max_api_time: float = 0.0
     start_time: float = field(default_factory=time.perf_counter)
+    # Log-spaced histogram of API durations, used for percentiles: bucket 0
+    # holds durations up to API_TIME_BUCKET_MIN, bucket i > 0 those up to
+    # API_TIME_BUCKET_MIN * API_TIME_BUCKET_GROWTH ** i (the last is open-ended)
+    api_time_buckets: array = field(
+        default_factory=lambda: array('L', [0]) * Metrics.API_TIME_BUCKET_COUNT, repr=False)
+    # API calls are recorded from the detail worker threads
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    # Histogram layout: 1 ms lower bucket, 10% wide buckets up to about an hour
+    API_TIME_BUCKET_MIN: ClassVar[float] = 0.001
+    API_TIME_BUCKET_GROWTH: ClassVar[float] = 1.1
+    API_TIME_BUCKET_COUNT: ClassVar[int] = 160
 
     def record_api_call(self, duration: float) -> None:
         """Record an API call with its duration."""
-        self.api_calls += 1
-        self.total_api_time += duration
-        self.min_api_time = min(self.min_api_time, duration)
-        self.max_api_time = max(self.max_api_time, duration)
+        if duration <= self.API_TIME_BUCKET_MIN:
+            bucket = 0
+        else:
+            bucket = min(
+                self.API_TIME_BUCKET_COUNT - 1,
+                1 + int(math.log(duration / self.API_TIME_BUCKET_MIN)
+                        / math.log(self.API_TIME_BUCKET_GROWTH)))
+        with self._lock:
+            self.api_time_buckets[bucket] += 1
+            self.api_calls += 1
+            self.total_api_time += duration
+            self.min_api_time = min(self.min_api_time, duration)
+            self.max_api_time = max(self.max_api_time, duration)
+
+    def api_time_percentiles(self, *percents: float) -> List[float]:
+        """
+        Calculates percentiles of the API response times from the histogram.
+
+        Each value is the upper bound of the bucket holding that rank (within
+        10% of the exact duration), capped at the slowest recorded call.
+
+        Args:
+            percents: Percentiles to calculate (0-100)
+
+        Returns:
+            Durations in seconds, one per requested percentile (0.0 if no samples)
+        """
+        with self._lock:
+            counts = self.api_time_buckets.tolist()
+            total = self.api_calls
+            max_time = self.max_api_time
+        if not total:
+            return [0.0 for _ in percents]
+        results = []
+        for pct in percents:
+            rank = min(total, int(total * pct / 100) + 1)
+            seen = 0
+            for bucket, count in enumerate(counts):
+                seen += count
+                if seen >= rank:
+                    break
+            upper = self.API_TIME_BUCKET_MIN * self.API_TIME_BUCKET_GROWTH ** bucket
+            results.append(min(upper, max_time))
+        return results
 
     @property
     def avg_api_time(self) -> float:
@@ -122,6 +290,7 @@ class Metrics:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary for serialization."""
+        p50_api_time, p95_api_time = self.api_time_percentiles(50, 95)
         return {
             'logs_processed': self.logs_processed,
             'errors_count': self.errors_count,
@@ -132,6 +301,8 @@ class Metrics:
                 if self.min_api_time != float('inf') else 0.0
             ),
             'max_api_time_ms': round(self.max_api_time * 1000, 2),
+            'p50_api_time_ms': round(p50_api_time * 1000, 2),
+            'p95_api_time_ms': round(p95_api_time * 1000, 2),
             'error_rate_percent': round(self.error_rate, 2),
             'elapsed_time_seconds': round(self.elapsed_time, 2),
             'logs_per_second': round(self.logs_per_second, 3),
@@ -139,6 +310,144 @@ class Metrics:
         }
 
 
+class _RateController:
+    """
+    Adaptive client-side pacing for one API host, shared by all instances.
+
+    Requests are unpaced until the server throttles (HTTP 429). A throttle
+    halves the pacing rate (starting from the recently observed request rate)
+    and honors Retry-After; every success then adds roughly one request per
+    second per second (AIMD) until pacing is lifted again. Pacing intervals
+    are jittered so parallel workers don't fire in lockstep.
+    """
+
+    MIN_RATE = 0.5           # requests per second
+    MAX_RATE = 200.0         # pacing is lifted above this rate
+    DECREASE_FACTOR = 0.5
+    JITTER = (0.8, 1.2)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rate: Optional[float] = None  # None = unpaced
+        self._next_allowed = 0.0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._observed_rate = 0.0
+
+    def acquire(self) -> None:
+        """Blocks until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            # Track the recent request rate as the starting point for a throttle
+            self._window_count += 1
+            window = now - self._window_start
+            if window >= 1.0:
+                self._observed_rate = self._window_count / window
+                self._window_start = now
+                self._window_count = 0
+
+            slot = max(now, self._next_allowed)
+            if self._rate is not None:
+                self._next_allowed = slot + random.uniform(*self.JITTER) / self._rate
+            elif slot > now:
+                # Still waiting out a Retry-After window
+                self._next_allowed = slot
+        delay = slot - now
+        if delay > 0:
+            _interruptible_sleep(delay)
+
+    def on_success(self) -> None:
+        """Additive increase of the pacing rate after a successful response."""
+        if self._rate is None:
+            return
+        with self._lock:
+            if self._rate is not None:
+                self._rate += 1.0 / self._rate
+                if self._rate >= self.MAX_RATE:
+                    self._rate = None
+
+    def on_throttle(self, retry_after: Optional[float]) -> None:
+        """
+        Multiplicative decrease of the pacing rate after an HTTP 429.
+
+        Args:
+            retry_after: Seconds requested by the server's Retry-After header, if any
+        """
+        with self._lock:
+            base = self._rate if self._rate is not None else (
+                self._observed_rate or self.MAX_RATE)
+            self._rate = max(self.MIN_RATE, min(base, self.MAX_RATE) * self.DECREASE_FACTOR)
+            if retry_after:
+                self._next_allowed = max(self._next_allowed, time.monotonic() + retry_after)
+
+
+# Per-host in-flight semaphore held by this thread's current request; released
+# by _ThrottleAwareRetry while it waits between attempts
+_in_flight_slot = threading.local()
+
+
+class RetryAbortedError(RuntimeError):
+    """Raised when a wait between retries is cut short by a shutdown request."""
+
+
+class _ThrottleAwareRetry(Retry):
+    """
+    urllib3 Retry that reports every HTTP 429 to the host's rate controller.
+
+    Backoff without a Retry-After header uses capped exponential delays with
+    full jitter, so workers that failed together don't retry in lockstep.
+    Retry-After is capped the same way. Waits between attempts end early on
+    shutdown and raise RetryAbortedError instead of sending another attempt,
+    and give up the thread's in-flight slot so other requests can use it.
+    """
+
+    # Upper bound for a single backoff delay or Retry-After wait (seconds)
+    MAX_BACKOFF_DELAY = 30.0
+
+    def __init__(self, *args: Any, rate_controller: Optional[_RateController] = None,
+                 **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.rate_controller = rate_controller
+
+    def new(self, **kw: Any) -> Retry:
+        new_retry = super().new(**kw)
+        new_retry.rate_controller = self.rate_controller
+        return new_retry
+
+    def increment(self, method=None, url=None, response=None, error=None,  # pylint: disable=too-many-arguments
+                  _pool=None, _stacktrace=None) -> Retry:
+        if (self.rate_controller is not None and response is not None
+                and response.status == 429):
+            self.rate_controller.on_throttle(self.get_retry_after(response))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    def get_backoff_time(self) -> float:
+        delay = min(super().get_backoff_time(), self.MAX_BACKOFF_DELAY)
+        return random.uniform(0, delay) if delay > 0 else 0.0
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.MAX_BACKOFF_DELAY)
+
+    def sleep(self, response: Any = None) -> None:
+        delay = None
+        if self.respect_retry_after_header and response:
+            delay = self.get_retry_after(response)
+        if not delay:
+            delay = self.get_backoff_time()
+        if delay > 0:
+            slot = getattr(_in_flight_slot, 'semaphore', None)
+            if slot is not None:
+                slot.release()
+            try:
+                _interruptible_sleep(delay)
+            finally:
+                if slot is not None:
+                    slot.acquire()
+        if MailLogger._shutdown_flag:  # pylint: disable=protected-access
+            raise RetryAbortedError("Shutdown requested while waiting to retry")
+
+
 class MailLogger: # pylint: disable=too-many-instance-attributes
     """
     Manages mail event logging from Uzman Posta API.
@@ -151,8 +460,56 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         metrics: Metrics instance for tracking runtime statistics
     """
 
-    # Global shutdown event shared across all instances
-    _shutdown_event = threading.Event()
+    # Global shutdown flag shared across all instances. A plain bool is enough:
+    # it is only ever set to True and every loop polls it, nothing blocks on it.
+    _shutdown_flag = False
+
+    # HTTP sessions shared across instances, keyed by endpoint URL and HTTP settings
+    _session_cache: Dict[Tuple[Any, ...], requests.Session] = {}
+    _session_lock = threading.Lock()
+
+    # Adaptive request pacing per API host, shared across instances
+    _rate_controllers: Dict[str, _RateController] = {}
+
+    # Per-host caps on concurrent requests across all instances, keyed by (host, limit)
+    _in_flight_limits: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+
+    # Maximum number of entries kept in the ETag cache file
+    ETAG_CACHE_LIMIT = 1000
+
+    # Position file record width: decimal timestamp, space padded, rewritten in place
+    POSITION_RECORD_WIDTH = 20
+
+    # Detail fetch progress is logged every this many percent ...
+    PROGRESS_LOG_STEP = 10
+    # ... or after this many seconds without a progress line
+    PROGRESS_LOG_INTERVAL = 5.0
+
+    # Minimum seconds between mid-page position writes (page ends always write)
+    CHECKPOINT_INTERVAL = 1.0
+
+    # zlib level for `.gz` output files (1 = fastest; most of the ratio on JSON lines)
+    GZIP_COMPRESS_LEVEL = 1
+
+    # Seconds close() waits for queued error lines to be written
+    ERROR_WRITER_JOIN_TIMEOUT = 5.0
+
+    # Smoothing factor for the records-per-second density estimate
+    DENSITY_EWMA_ALPHA = 0.3
+
+    # Adaptive interval step in split_and_retrieve_logs: halved (down to the
+    # floor, in seconds) when an interval had to be split, grown back by a
+    # fraction of the configured step when one came back under the low-water mark
+    MIN_INTERVAL_STEP = 15
+    INTERVAL_STEP_GROWTH = 0.25
+    INTERVAL_LOW_WATER = 0.2    # fraction of max_records_per_page
+
+    # Seconds a DNS check result is reused when classifying connection errors
+    DNS_CHECK_TTL = 60
+
+    # strftime directives that change once a minute / more often than once a minute
+    _MINUTE_DIRECTIVES = ('M', 'R')
+    _SUB_MINUTE_DIRECTIVES = ('S', 'f', 'X', 'c', 'T', 'r', 's')
 
     def __init__(self, cfg: MailLoggerConfig) -> None:
         """
@@ -164,12 +521,37 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         self.config = cfg
         self.metrics = Metrics()
 
-        # Ensure directories exist
-        os.makedirs(self.config.log_directory, exist_ok=True)
+        # log_message settings, fixed for the instance (set up before anything logs)
+        self._verbose = self.config.verbose
+        self._log_prefix = f"[{self.config.section_name}] " if self.config.section_name else ""
+
+        # Append-only descriptor for the current error log file, reopened when the
+        # resolved path changes (set up before anything can call log_error)
+        self._error_fd: Optional[int] = None
+        self._error_fd_path: Optional[str] = None
+        self._error_fd_lock = threading.Lock()
+        # (valid until, path) of the resolved error log file name
+        self._error_path_cache: Tuple[float, str] = (0.0, '')
+        # Error lines are appended by a background writer thread, started on the
+        # first error; after close() they are written synchronously again
+        self._error_queue: "queue.Queue[Optional[Tuple[str, bytes]]]" = queue.Queue()
+        self._error_writer: Optional[threading.Thread] = None
+        self._error_writer_closed = False
+        # Fields that are the same in every error record, encoded once
+        self._error_static_fields = (
+            b',"api_key":' + _json_dumps(self._mask_api_key(self.config.api_key))
+            + b',"domain":' + _json_dumps(self.config.domain)
+            + b',"type":' + _json_dumps(self.config.log_type))
+
+        # Ensure directories exist; writability is checked here once rather than
+        # on every write
+        _ensure_dir(self.config.log_directory)
+        if not os.access(self.config.log_directory, os.W_OK):
+            raise PermissionError(f"Log directory '{self.config.log_directory}' is not writable.")
         if self.config.position_file:
-            os.makedirs(os.path.dirname(os.path.abspath(self.config.position_file)), exist_ok=True)
+            _ensure_dir(os.path.dirname(os.path.abspath(self.config.position_file)))
         if self.config.lock_file_path:
-            os.makedirs(os.path.dirname(os.path.abspath(self.config.lock_file_path)), exist_ok=True)
+            _ensure_dir(os.path.dirname(os.path.abspath(self.config.lock_file_path)))
 
         self._setup_signal_handlers()
         self.setup_logging()
@@ -178,21 +560,260 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         self.lock_file_path = None
         self.lock_file = None
 
-        # Initialize session and headers
-        self.auth_headers = {'Authorization': f'Bearer {self.config.api_key}'}
-        self.session = requests.Session() if self.config.use_session else None
-        if self.session:
-            self.session.headers.update(self.auth_headers)
+        # Smoothed records-per-second estimate used to size interval splits
+        self._density_ewma: Optional[float] = None
+        # Number of full pages split so far (tells callers a range was saturated)
+        self._page_splits = 0
+
+        # hostname -> (checked at, resolves) for connection error classification
+        self._dns_cache: Dict[str, Tuple[float, bool]] = {}
+
+        # Timestamp extractor for records, resolved once for this category
+        self._extract_item_time = (
+            self._mail_item_time if self.config.api_category == 'mail'
+            else self._generic_item_time)
+
+        # Output file name format with {domain}/{type} substituted, and the
+        # directory prefix it is appended to (both fixed for the instance).
+        # An absolute format is used as is, as os.path.join would do
+        display_domain = self.config.domain if self.config.domain else 'global'
+        # For authentication, use 'auth' instead of the default log_type
+        type_value = (
+            'auth' if self.config.api_category == 'authentication' else self.config.log_type)
+        self._log_name_format = self.config.log_file_name_format.replace(
+            '{domain}', display_domain).replace('{type}', type_value)
+        self._log_dir_prefix = (
+            '' if os.path.isabs(self._log_name_format)
+            else os.path.join(self.config.log_directory, ''))
+        # Resolved output file path, reused until the next hour (or minute) boundary
+        self._cached_log_path: Optional[str] = None
+        self._cached_log_until = 0.0
+
+        # Output log stream, reopened only when the resolved file name changes
+        self._log_fp: Optional[BinaryIO] = None
+        self._log_fp_path: Optional[str] = None
+
+        # Position file descriptor for in-place checkpoint writes (opened on first save)
+        self._pos_fd: Optional[int] = None
+        self._position_dir_ok = False
+        # Coalesced checkpoint not yet written, and when the last write happened
+        self._pending_checkpoint: Optional[int] = None
+        self._last_checkpoint_flush = 0.0
+        # Last timestamp successfully written (or loaded), to skip rewriting an
+        # unchanged value; once loaded it also answers load_last_position
+        self._last_saved_ts: Optional[int] = None
+        self._position_loaded = False
+
+        # Initialize session and headers. Headers are built once and passed by
+        # reference on every request; Accept-Encoding is left to requests, which
+        # already advertises gzip/deflate by default.
+        self._request_headers = {
+            'Authorization': f'Bearer {self.config.api_key}',
+            'Accept': 'application/json'
+        }
+        # List query parameters that don't change between pages, percent-encoded
+        # once; only starttime/endtime are formatted per request
+        static_params: Dict[str, str] = {}
+        # Only include 'type' for categories that use it (mail, quarantine)
+        if self.config.api_category != 'authentication':
+            static_params['type'] = self.config.log_type
+        if self.config.domain:
+            static_params['domain'] = self.config.domain
+        self._list_url_prefix = (
+            f"{self.config.url}{'&' if '?' in self.config.url else '?'}starttime=")
+        self._list_query_suffix = f"&{urlencode(static_params)}" if static_params else ''
+        # Sessions are shared between instances with the same endpoint and HTTP
+        # settings, so the Authorization header is sent per request instead.
+        # With use_session disabled the instance still keeps its own pooled
+        # session (not shared), so connections are reused across its requests.
+        self._owns_session = not self.config.use_session
+        self._rate_controller = self._get_rate_controller()
+        self.session = self._get_session() if self.config.use_session else self._build_session()
+        self._in_flight = self._get_in_flight_limit()
+
+        # Conditional GET cache (request hash -> ETag), persisted beside the position file
+        self._etag_cache_path = (
+            f"{os.path.splitext(self.config.position_file)[0]}_etag_cache.json")
+        self._etag_cache: Optional[Dict[str, str]] = (
+            self._load_etag_cache() if self.config.enable_etag_cache else None)
+
+        # API timing is skipped entirely when metrics collection is disabled
+        self._collect_metrics = self.config.collect_metrics
+
+        # Single background worker that prefetches the next list page
+        self._page_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page")
+
+        # Long-lived worker pool for detail requests, reused across sub-batches and intervals
+        self._detail_pool = ThreadPoolExecutor(
+            max_workers=self.config.max_parallel_details, thread_name_prefix="detail")
 
     def close(self) -> None:
-        """Ensure session is closed explicitly."""
-        if hasattr(self, 'session') and isinstance(self.session, requests.Session):
+        """
+        Ensure detail worker pool and output log stream are closed explicitly.
+
+        A shared HTTP session is left open for other instances; it is closed
+        by close_shared_sessions() once all sections have finished.
+        """
+        if hasattr(self, '_page_pool'):
+            self._page_pool.shutdown(wait=True)
+        if hasattr(self, '_detail_pool'):
+            self._detail_pool.shutdown(wait=True)
+        if getattr(self, '_owns_session', False) and self.session is not None:
+            self.session.close()
+            self.session = None
+        self._close_log_stream()
+        if getattr(self, '_pending_checkpoint', None) is not None:
+            self.save_last_position(self._pending_checkpoint, force=True)
+        self._close_position_fd()
+        if self._stop_error_writer():
+            with self._error_fd_lock:
+                self._close_error_fd()
+
+    @classmethod
+    def close_shared_sessions(cls) -> None:
+        """Close all cached HTTP sessions shared between instances."""
+        with cls._session_lock:
+            sessions = list(cls._session_cache.values())
+            cls._session_cache.clear()
+        for session in sessions:
             try:
-                self.session.close()
-                self.log_message("Session closed")
+                session.close()
             except Exception: # pylint: disable=broad-exception-caught
                 pass
 
+    def _build_retry(self, retries: int, sleep_time: int) -> Retry:
+        """
+        Builds the urllib3 retry policy used by the HTTP adapters.
+
+        Args:
+            retries: Maximum number of retries
+            sleep_time: Backoff factor in seconds (doubles on every retry, jittered)
+
+        Returns:
+            Retry instance honoring Retry-After on HTTP 429/503 and reporting
+            throttles to the host's rate controller. Other 4xx responses are
+            not retried.
+        """
+        return _ThrottleAwareRetry(
+            rate_controller=self._rate_controller,
+            total=retries,
+            backoff_factor=sleep_time,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+
+    def _build_session(self) -> requests.Session:
+        """
+        Creates a requests.Session with pooled, retrying HTTP adapters.
+
+        List and detail endpoints get separate adapters mounted by URL prefix
+        (the longest prefix wins), so each follows its own retry settings and
+        the detail pool is large enough for all parallel workers.
+
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+        list_adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=4,
+            max_retries=self._build_retry(self.config.list_retries, self.config.list_sleep_time))
+        detail_adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=max(self.config.max_parallel_details * 2, 10),
+            max_retries=self._build_retry(
+                self.config.detail_retries, self.config.detail_sleep_time))
+        session.mount(self.config.url, list_adapter)
+        session.mount(f"{self.config.url.rstrip('/')}/", detail_adapter)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        """
+        Returns a pooled session shared by all instances using the same endpoint
+        URL and HTTP settings, creating it on first use (thread-safe).
+
+        Sharing lets sections that query the same host (e.g. incoming and
+        outgoing mail of several domains) reuse keep-alive connections instead
+        of paying DNS and TLS handshakes per instance.
+
+        Returns:
+            Shared requests.Session
+        """
+        cache_key = (
+            self.config.url, self.config.list_retries, self.config.list_sleep_time,
+            self.config.detail_retries, self.config.detail_sleep_time,
+            self.config.max_parallel_details
+        )
+        with MailLogger._session_lock:
+            session = MailLogger._session_cache.get(cache_key)
+            if session is None:
+                session = self._build_session()
+                MailLogger._session_cache[cache_key] = session
+        return session
+
+    def _get_rate_controller(self) -> _RateController:
+        """Returns the adaptive rate controller shared by all instances for this host."""
+        host = urlparse(self.config.url).netloc
+        with MailLogger._session_lock:
+            controller = MailLogger._rate_controllers.get(host)
+            if controller is None:
+                controller = MailLogger._rate_controllers[host] = _RateController()
+        return controller
+
+    def _get_in_flight_limit(self) -> Optional[threading.BoundedSemaphore]:
+        """
+        Returns the semaphore bounding concurrent requests to this endpoint's host.
+
+        Parallel sections each run their own detail workers; the shared
+        semaphore keeps their combined outstanding requests under the API's
+        admission limit.
+
+        Returns:
+            Shared BoundedSemaphore, or None if max_in_flight_requests <= 0
+        """
+        limit = self.config.max_in_flight_requests
+        if limit <= 0:
+            return None
+        key = (urlparse(self.config.url).netloc, limit)
+        with MailLogger._session_lock:
+            semaphore = MailLogger._in_flight_limits.get(key)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(limit)
+                MailLogger._in_flight_limits[key] = semaphore
+        return semaphore
+
+    def _http_get(self, url: str, *, timeout: int,
+                  headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Issues a GET request through the instance's pooled session.
+
+        Args:
+            url: Request URL
+            timeout: Request timeout in seconds
+            headers: Optional extra request headers
+
+        Returns:
+            The requests.Response object
+        """
+        request_headers = (
+            {**self._request_headers, **headers} if headers else self._request_headers)
+        self._rate_controller.acquire()
+        if self._in_flight is None:
+            response = self.session.get(
+                url, headers=request_headers, timeout=timeout)
+        else:
+            with self._in_flight:
+                # Counted per attempt: the retry policy frees the slot while it waits
+                _in_flight_slot.semaphore = self._in_flight
+                try:
+                    response = self.session.get(
+                        url, headers=request_headers, timeout=timeout)
+                finally:
+                    _in_flight_slot.semaphore = None
+        if response.status_code < 400:
+            self._rate_controller.on_success()
+        return response
+
     def _setup_signal_handlers(self) -> None:
         """Configure signal handlers for graceful shutdown (main thread only)."""
         if threading.current_thread() is threading.main_thread():
@@ -209,12 +830,12 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         """
         signal_name = 'SIGTERM' if signum == signal.SIGTERM else 'SIGINT'
         self.log_message(f"Received {signal_name}, notifying all instances to shut down...")
-        MailLogger._shutdown_event.set()
+        MailLogger._shutdown_flag = True
 
     @property
     def _shutdown_requested(self) -> bool:
-        """Check if shutdown has been requested via the shared event."""
-        return MailLogger._shutdown_event.is_set()
+        """Check if shutdown has been requested via the shared flag."""
+        return MailLogger._shutdown_flag
 
     def _parse_api_error(self, response: requests.Response) -> str:
         """
@@ -237,7 +858,7 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         error_details = [f"HTTP {status_code} ({status_text})"]
 
         try:
-            error_json = response.json()
+            error_json = _json_loads(response.content)
             if isinstance(error_json, dict):
                 details = []
                 for key, value in error_json.items():
@@ -264,12 +885,15 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         Args:
             message: Text to log
         """
-        prefix = f"[{self.config.section_name}] " if self.config.section_name else ""
-        if self.config.verbose:
-            self.message_logger.info("%s%s", prefix, message)
+        if self._verbose:
+            self.message_logger.info("%s%s", self._log_prefix, message)
         else:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            print(f"[{timestamp}] {prefix}{message}")
+            print(f"[{_console_timestamp()}] {self._log_prefix}{message}")
+
+    @staticmethod
+    def _format_timestamp(timestamp: int) -> str:
+        """Formats a Unix timestamp as local 'YYYY-MM-DD HH:MM:SS' for log messages."""
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
 
     def _safe_replace(self, src: str, dst: str, max_retries: int = 5, delay: float = 0.5) -> None:
         """
@@ -283,10 +907,8 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         """
         for i in range(max_retries):
             try:
-                if os.name == 'nt' and os.path.exists(dst):
-                    os.replace(src, dst)
-                else:
-                    os.rename(src, dst)
+                # os.replace is atomic and overwrites dst on both POSIX and Windows
+                os.replace(src, dst)
                 return
             except (PermissionError, OSError) as _e:
                 if i == max_retries - 1:
@@ -297,17 +919,9 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         """
         Configures logging setup for the application.
 
-        Creates the log directory if it doesn't exist and configures message logging
-        when verbose mode is enabled. Raises PermissionError if log directory is not writable.
-
-        Raises:
-            PermissionError: If log directory is not writable
+        Configures message logging when verbose mode is enabled and cleans up old
+        log files. The log directory itself is created and checked in __init__.
         """
-        if not os.path.exists(self.config.log_directory):
-            os.makedirs(self.config.log_directory)
-        elif not os.access(self.config.log_directory, os.W_OK):
-            raise PermissionError(f"Log directory '{self.config.log_directory}' is not writable.")
-
         # Set up a separate logger for general messages only if verbose is True
         # Use a unique name per section to avoid conflicts in parallel mode
         logger_suffix = self.config.section_name or str(id(self))
@@ -315,9 +929,11 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
             self.message_logger = logging.getLogger(f'message_logger_{logger_suffix}')
             self.message_logger.setLevel(logging.INFO)
             self.message_logger.propagate = False
-            # Prevent handler accumulation
+            # Prevent handler accumulation (and close the file a previous instance
+            # of this section left open)
             for handler in self.message_logger.handlers[:]:
                 self.message_logger.removeHandler(handler)
+                handler.close()
 
             # Create a file handler for the general messages using the configured file name
             # Allow full path and strftime-style date formatting in config
@@ -331,26 +947,126 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
                 message_log_file_path = os.path.join(self.config.log_directory, resolved_filename)
 
             message_dir = os.path.dirname(message_log_file_path)
-            if message_dir and not os.path.exists(message_dir):
-                os.makedirs(message_dir, exist_ok=True)
+            if message_dir:
+                _ensure_dir(message_dir)
+
+            # A fixed (undated) file name is size-rotated before it is opened
+            message_rotated = False
+            if not self._has_date_tokens(self.config.message_log_file_name):
+                try:
+                    message_rotated = self._rotate_if_large(
+                        message_log_file_path, self.config.log_max_bytes,
+                        self.config.message_log_retention_count)
+                except OSError as rotate_error:
+                    self.log_error(
+                        f"Failed to rotate message log {message_log_file_path}: {rotate_error}")
 
             message_file_handler = logging.FileHandler(message_log_file_path, encoding='utf-8')
             message_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
 
             # Add the handler to the message logger
             self.message_logger.addHandler(message_file_handler)
+            if message_rotated:
+                self.message_logger.info("Rotated message log: %s", message_log_file_path)
 
             # Cleanup old message logs and log actions into the message logger
             self.cleanup_old_message_logs(retention_count=self.config.message_log_retention_count)
 
-        # Initialize an email logger instance attribute
-        self.email_logger = logging.getLogger(f'email_logger_{logger_suffix}')
-        self.email_logger.setLevel(logging.INFO)
-        self.email_logger.propagate = False
-
         # Cleanup old error logs
         self.cleanup_old_error_logs(retention_count=self.config.error_log_retention_count)
 
+    @staticmethod
+    def _has_date_tokens(pattern: str) -> bool:
+        """Returns True if a file name pattern contains strftime date/time directives."""
+        return any(tok in pattern for tok in ("%Y", "%y", "%m", "%d", "%H", "%M", "%S"))
+
+    @classmethod
+    def _name_valid_until(cls, pattern: str, now: float, local_now: time.struct_time) -> float:
+        """
+        Returns until when a strftime file name rendered at `now` stays the same.
+
+        Args:
+            pattern: strftime pattern the name was rendered from
+            now: Unix timestamp the name was rendered for
+            local_now: time.localtime(now)
+
+        Returns:
+            Unix timestamp of the next local minute boundary if the pattern uses
+            %M / %R, of the next local hour boundary otherwise, or 0.0 if the
+            pattern has sub-minute directives and must not be cached
+        """
+        if any(f'%{d}' in pattern for d in cls._SUB_MINUTE_DIRECTIVES):
+            return 0.0
+        # Start of the next local minute (handles non-whole-hour UTC offsets)
+        boundary = int(now) - local_now.tm_sec + 60
+        if not any(f'%{d}' in pattern for d in cls._MINUTE_DIRECTIVES):
+            # Start of the next local hour
+            boundary += 3600 - 60 * (local_now.tm_min + 1)
+        return float(boundary)
+
+    def _rotate_if_large(self, path: str, max_bytes: int, backup_count: int) -> bool:
+        """
+        Rotates a fixed-name log file once it has grown past `max_bytes`.
+
+        Existing backups are shifted up (path.1 -> path.2, ...), the oldest one
+        beyond `backup_count` is overwritten, and the active file becomes path.1.
+        Only a single os.stat is needed when no rotation is due.
+
+        Args:
+            path: Active log file path
+            max_bytes: Size limit in bytes (0 disables rotation)
+            backup_count: Number of numbered backups to keep
+
+        Returns:
+            True if the file was rotated
+        """
+        if max_bytes <= 0 or backup_count <= 0:
+            return False
+        try:
+            if os.stat(path).st_size <= max_bytes:
+                return False
+        except FileNotFoundError:
+            return False
+
+        for index in range(backup_count - 1, 0, -1):
+            try:
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+            except FileNotFoundError:
+                continue
+        self._safe_replace(path, f"{path}.1")
+        return True
+
+    @staticmethod
+    def _scan_dated_files(
+            directory: str, filename_pattern: str) -> List[Tuple[datetime, os.DirEntry]]:
+        """
+        Lists files in a directory whose names match a strftime-style pattern.
+
+        Uses a single os.scandir pass and skips names that don't start with the
+        pattern's literal prefix before attempting the (slow) strptime parse.
+
+        Args:
+            directory: Directory to scan
+            filename_pattern: strftime-style file name pattern (no directory part)
+
+        Returns:
+            List of (parsed datetime, DirEntry) tuples for matching files
+        """
+        literal_prefix = filename_pattern.split('%', 1)[0]
+        parsed_files: List[Tuple[datetime, os.DirEntry]] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.startswith(literal_prefix) or not entry.is_file():
+                    continue
+                # Try to parse the filename according to the configured pattern
+                try:
+                    file_dt = datetime.strptime(entry.name, filename_pattern)
+                except ValueError:
+                    # Skip files that don't match the pattern
+                    continue
+                parsed_files.append((file_dt, entry))
+        return parsed_files
+
     def cleanup_old_message_logs(self, retention_count: int = 2) -> None:
         """
         Deletes old message log files keeping only the most recent `retention_count` files.
@@ -358,16 +1074,10 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         Args:
             retention_count: Number of recent log files to keep
         """
-        # If the configured message log name does not contain any date directives,
-        # we cannot safely infer per-period filenames for cleanup.
+        # Without date directives there are no per-period files to clean up;
+        # the single file is size-rotated in setup_logging instead.
         pattern = self.config.message_log_file_name
-        has_date_tokens = any(tok in pattern for tok in ("%Y", "%y", "%m", "%d", "%H", "%M", "%S"))
-        if not has_date_tokens:
-            if hasattr(self, "message_logger"):
-                self.message_logger.info(
-                    "message_log_retention_count is set but message_log_file_name has no "
-                    "date/time tokens; skipping old message log cleanup."
-                )
+        if not self._has_date_tokens(pattern):
             return
 
         # Build directory and filename pattern from the configured template
@@ -379,32 +1089,23 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         # Use only the filename part for strptime (directory is handled separately)
         filename_pattern = os.path.basename(pattern)
 
-        parsed_files: List[Tuple[datetime, str]] = []
-        for fname in os.listdir(message_dir):
-            # Try to parse the filename according to the configured pattern
-            try:
-                file_dt = datetime.strptime(fname, filename_pattern)
-            except ValueError:
-                # Skip files that don't match the pattern
-                continue
-            parsed_files.append((file_dt, fname))
+        parsed_files = self._scan_dated_files(message_dir, filename_pattern)
 
         # Eğer dosya sayısı retention_count'tan az veya eşitse, silinecek bir şey yok
-        if len(parsed_files) <= retention_count:
+        if retention_count <= 0 or len(parsed_files) <= retention_count:
             return
 
-        # Tarih-saat sırasına göre eski->yeni sırala
-        parsed_files.sort(key=lambda x: x[0])
-        # Sadece son retention_count dosya kalsın, geri kalanlar silinsin
-        files_to_delete = parsed_files[:-retention_count]
+        # Sadece en yeni retention_count dosya kalsın (tam sıralama yerine O(N log k) seçim)
+        keep = set(heapq.nlargest(retention_count, parsed_files, key=lambda x: x[0]))
+        files_to_delete = [entry for entry in parsed_files if entry not in keep]
 
-        for _, fname in files_to_delete:
+        for _, entry in files_to_delete:
             try:
-                os.remove(os.path.join(message_dir, fname))
+                os.remove(entry.path)
                 if hasattr(self, "message_logger"):
-                    self.message_logger.info("Removed old message log: %s", fname)
+                    self.message_logger.info("Removed old message log: %s", entry.name)
             except Exception as _e: # pylint: disable=broad-exception-caught
-                self.log_error(f"Failed to delete old message log {fname}: {_e}")
+                self.log_error(f"Failed to delete old message log {entry.name}: {_e}")
 
     def cleanup_old_error_logs(self, retention_count: int = 2) -> None:
         """
@@ -414,8 +1115,17 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
             retention_count: Number of recent log files to keep
         """
         pattern = self.config.error_log_file_name
-        has_date_tokens = any(tok in pattern for tok in ("%Y", "%y", "%m", "%d", "%H", "%M", "%S"))
-        if not has_date_tokens:
+        if not self._has_date_tokens(pattern):
+            # Fixed error log name: rotate by size instead of scanning the directory
+            suffix = f"_{self.config.section_name}" if self.config.section_name else ""
+            error_log_path = os.path.join(self.config.log_directory, f'errors{suffix}.log')
+            try:
+                if self._rotate_if_large(
+                        error_log_path, self.config.log_max_bytes, retention_count):
+                    if hasattr(self, "message_logger"):
+                        self.message_logger.info("Rotated error log: %s", error_log_path)
+            except OSError:
+                pass
             return
 
         # Build directory and filename pattern
@@ -431,25 +1141,20 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         if not os.path.isdir(error_dir):
             return
 
-        parsed_files: List[Tuple[datetime, str]] = []
-        for fname in os.listdir(error_dir):
-            try:
-                file_dt = datetime.strptime(fname, filename_pattern)
-            except ValueError:
-                continue
-            parsed_files.append((file_dt, fname))
+        parsed_files = self._scan_dated_files(error_dir, filename_pattern)
 
-        if len(parsed_files) <= retention_count:
+        if retention_count <= 0 or len(parsed_files) <= retention_count:
             return
 
-        parsed_files.sort(key=lambda x: x[0])
-        files_to_delete = parsed_files[:-retention_count]
+        # Keep only the newest retention_count files (O(N log k) selection, no full sort)
+        keep = set(heapq.nlargest(retention_count, parsed_files, key=lambda x: x[0]))
+        files_to_delete = [entry for entry in parsed_files if entry not in keep]
 
-        for _, fname in files_to_delete:
+        for _, entry in files_to_delete:
             try:
-                os.remove(os.path.join(error_dir, fname))
+                os.remove(entry.path)
                 if hasattr(self, "message_logger"):
-                    self.message_logger.info("Removed old error log: %s", fname)
+                    self.message_logger.info("Removed old error log: %s", entry.name)
             except (OSError, IOError):
                 pass
 
@@ -457,36 +1162,69 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         """
         Generates log file name based on configured format and current timestamp.
 
+        The resolved path is cached until the next hour boundary, or the next
+        minute boundary if the format contains %M / %R. Formats with
+        sub-minute directives (e.g. %S) are not cached.
+
         Returns:
             Generated log file path
 
         Raises:
             ValueError: If log file name format is invalid
         """
+        now = time.time()
+        if now < self._cached_log_until:
+            return self._cached_log_path
         try:
-            filename_format = self.config.log_file_name_format
-            # Replace placeholders
-            display_domain = self.config.domain if self.config.domain else 'global'
-            filename_format = filename_format.replace('{domain}', display_domain)
-            # For authentication, use 'auth' instead of the default log_type
-            type_value = (
-                'auth' if self.config.api_category == 'authentication'
-                else self.config.log_type
-            )
-            filename_format = filename_format.replace('{type}', type_value)
-
-            return os.path.join(self.config.log_directory, datetime.now().strftime(filename_format))
+            filename_format = self._log_name_format
+            if '%f' in filename_format:
+                # Microseconds are only supported by datetime.strftime
+                return self._log_dir_prefix + datetime.fromtimestamp(now).strftime(
+                    filename_format)
+
+            local_now = time.localtime(now)
+            log_path = self._log_dir_prefix + time.strftime(filename_format, local_now)
+            valid_until = self._name_valid_until(filename_format, now, local_now)
+            if valid_until:
+                self._cached_log_path = log_path
+                self._cached_log_until = valid_until
+            return log_path
         except ValueError as e:
             self.log_error(f"Invalid log file name format: {e}")
             self.log_message("Using default log file name due to invalid format.")
             return os.path.join(self.config.log_directory, "default_log.json")
 
-    def save_last_position(self, endtime: int) -> None:
+    def save_last_position(self, endtime: int, *, force: bool = False) -> None:
+        """
+        Records the last processed timestamp, coalescing checkpoint writes.
+
+        The position is written at most once every `CHECKPOINT_INTERVAL`
+        seconds; in between it is only kept as pending. Page boundaries, the
+        final checkpoint and shutdown pass `force=True` so nothing is lost.
+
+        Args:
+            endtime: Unix timestamp of last processed position
+            force: Write immediately regardless of the interval
+        """
+        if endtime == self._last_saved_ts:
+            # Already on disk (e.g. final checkpoint right after a page end)
+            self._pending_checkpoint = None
+            return
+        self._pending_checkpoint = endtime
+        now = time.monotonic()
+        if force or now - self._last_checkpoint_flush >= self.CHECKPOINT_INTERVAL:
+            self._last_checkpoint_flush = now
+            self._pending_checkpoint = None
+            self._write_checkpoint_now(endtime)
+
+    def _write_checkpoint_now(self, endtime: int) -> None:
         """
         Saves the last processed timestamp to position file atomically.
 
-        Uses write-to-temp-then-rename pattern to ensure crash safety.
-        If process crashes during write, the old position file remains intact.
+        Where os.pwrite is available the position file is kept open and the
+        timestamp is rewritten in place as a fixed-width record (a single
+        sector-sized write plus fsync). Elsewhere the write-to-temp-then-rename
+        pattern is used, so a crash during write leaves the old file intact.
 
         Args:
             endtime: Unix timestamp of last processed position
@@ -495,15 +1233,37 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
             PermissionError: If position directory is not writable
             IOError: If unable to write to position file
         """
-        # Support both relative filenames and explicit directories
-        position_dir = os.path.dirname(self.config.position_file)
-        if position_dir:
-            os.makedirs(position_dir, exist_ok=True)
-        else:
-            position_dir = '.'  # current directory
+        if self._pos_fd is None and not self._position_dir_ok:
+            # Support both relative filenames and explicit directories
+            position_dir = os.path.dirname(self.config.position_file)
+            if position_dir:
+                os.makedirs(position_dir, exist_ok=True)
+            else:
+                position_dir = '.'  # current directory
 
-        if not os.access(position_dir, os.W_OK):
-            raise PermissionError(f"Position file directory '{position_dir}' is not writable.")
+            if not os.access(position_dir, os.W_OK):
+                raise PermissionError(
+                    f"Position file directory '{position_dir}' is not writable.")
+            # Checked once; the rename fallback doesn't repeat it on every write
+            self._position_dir_ok = True
+
+            if hasattr(os, 'pwrite'):
+                try:
+                    self._pos_fd = os.open(
+                        self.config.position_file, os.O_RDWR | os.O_CREAT, 0o644)
+                except OSError as e:
+                    self.log_error(f"Failed to open position file, using atomic rename: {e}")
+
+        if self._pos_fd is not None:
+            # Fixed width, so each write fully overwrites the previous record
+            record = str(endtime).ljust(self.POSITION_RECORD_WIDTH).encode('ascii')
+            try:
+                os.pwrite(self._pos_fd, record, 0)
+                os.fsync(self._pos_fd)
+                self._last_saved_ts = endtime
+            except OSError as e:
+                self.log_error(f"Failed to save last position (timestamp={endtime}): {e}")
+            return
 
         # Atomic write: write to temp file, then rename
         temp_file = f"{self.config.position_file}.tmp"
@@ -516,6 +1276,7 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
 
             # Use safe replace with retries for Windows robustness
             self._safe_replace(temp_file, self.config.position_file)
+            self._last_saved_ts = endtime
 
         except (IOError, PermissionError, OSError) as e:
             self.log_error(f"Failed to save last position (timestamp={endtime}): {e}")
@@ -530,23 +1291,79 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         """
         Loads the last processed timestamp from position file.
 
+        The file is read once per instance; afterwards the value tracked by
+        the checkpoint writer is returned, since this instance (holding the
+        section lock) is the only writer.
+
         Returns:
             Last processed timestamp, or None if position file doesn't exist
+            or is still empty
 
         Raises:
             PermissionError: If position file is not readable
-            IOError: If unable to read position file
         """
-        if os.path.exists(self.config.position_file):
-            if not os.access(self.config.position_file, os.R_OK):
-                raise PermissionError(
-                    f"Position file '{self.config.position_file}' is not readable.")
-            try:
-                with open(self.config.position_file, 'r', encoding='utf-8') as file:
-                    return int(file.read().strip())
-            except IOError as e:
-                self.log_error(f"Failed to load last position: {e}")
-        return None
+        if self._position_loaded:
+            return self._last_saved_ts
+        try:
+            with open(self.config.position_file, 'r', encoding='utf-8') as file:
+                content = file.read().strip()
+        except FileNotFoundError:
+            self._position_loaded = True
+            return self._last_saved_ts
+        except PermissionError as e:
+            raise PermissionError(
+                f"Position file '{self.config.position_file}' is not readable.") from e
+        except IOError as e:
+            self.log_error(f"Failed to load last position: {e}")
+            return None
+        # An empty file is left behind if the first in-place write never happened
+        position = int(content) if content else None
+        if self._last_saved_ts is None:
+            self._last_saved_ts = position
+        self._position_loaded = True
+        return self._last_saved_ts
+
+    def _load_etag_cache(self) -> Dict[str, str]:
+        """
+        Loads the ETag cache used for conditional list requests.
+
+        Returns:
+            Mapping of request hash to ETag, empty if missing or unreadable
+        """
+        try:
+            with open(self._etag_cache_path, 'rb') as file:
+                cache = _json_loads(file.read())
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (IOError, ValueError) as e:
+            self.log_error(f"Failed to load ETag cache, starting empty: {e}")
+            return {}
+
+    def _store_etag(self, cache_key: str, etag: str) -> None:
+        """
+        Records the ETag of a fully written page and persists the cache atomically.
+
+        Only the most recent `ETAG_CACHE_LIMIT` entries are kept.
+
+        Args:
+            cache_key: Hash of the request URL and parameters
+            etag: ETag header value returned by the API
+        """
+        if self._etag_cache is None:
+            return
+        self._etag_cache.pop(cache_key, None)
+        self._etag_cache[cache_key] = etag
+        while len(self._etag_cache) > self.ETAG_CACHE_LIMIT:
+            del self._etag_cache[next(iter(self._etag_cache))]
+
+        temp_file = f"{self._etag_cache_path}.tmp"
+        try:
+            with open(temp_file, 'wb') as file:
+                file.write(_json_dumps(self._etag_cache))
+            self._safe_replace(temp_file, self._etag_cache_path)
+        except (IOError, PermissionError, OSError) as e:
+            self.log_error(f"Failed to save ETag cache: {e}")
 
     def update_heartbeat(self, status: str = "running") -> None:
         """
@@ -562,43 +1379,178 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
             "metrics": self.metrics.to_dict()
         }
         try:
-            with open(heartbeat_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(heartbeat_path, 'wb') as f:
+                f.write(_json_dumps(data, indent=True))
         except IOError as e:
             self.log_error(f"Failed to update heartbeat: {e}")
 
+    @staticmethod
+    def _mail_item_time(item: Dict[str, Any]) -> Any:
+        """Returns the timestamp of a mail log record (first recipient's time)."""
+        recipients = item.get('recipients')
+        if recipients:
+            return recipients[0].get('time')
+        return item.get('time')
+
+    @staticmethod
+    def _generic_item_time(item: Dict[str, Any]) -> Any:
+        """Returns the timestamp of a quarantine or authentication record."""
+        return item.get('time') or item.get('timestamp') or item.get('starttime')
+
+    def _build_page_request(
+            self, starttime: int, endtime: int
+    ) -> Tuple[str, Optional[str], Optional[Dict[str, str]]]:
+        """
+        Builds the list request for a time range.
+
+        Args:
+            starttime: Range start (Unix timestamp)
+            endtime: Range end (Unix timestamp)
+
+        Returns:
+            Tuple of (request URL with query string, ETag cache key or None,
+            conditional request headers or None)
+        """
+        # Static category-specific parameters are pre-encoded in __init__
+        page_url = (
+            f"{self._list_url_prefix}{starttime}&endtime={endtime}{self._list_query_suffix}")
+
+        # Conditional GET: a 304 means this exact range was already fully written
+        cache_key = None
+        request_headers = None
+        if self._etag_cache is not None:
+            cache_key = _hash_key(page_url.encode('utf-8'))
+            cached_etag = self._etag_cache.get(cache_key)
+            if cached_etag:
+                request_headers = {'If-None-Match': cached_etag}
+        return page_url, cache_key, request_headers
+
+    def _fetch_page(
+            self, page_url: str, headers: Optional[Dict[str, str]]
+    ) -> Tuple[requests.Response, Optional[float]]:
+        """
+        Issues a list request, recording its duration when metrics are enabled.
+
+        Args:
+            page_url: Request URL from _build_page_request
+            headers: Optional conditional request headers
+
+        Returns:
+            Tuple of (response, elapsed seconds or None if not measured)
+        """
+        if not self._collect_metrics:
+            return self._http_get(
+                page_url, headers=headers, timeout=self.config.list_timeout), None
+        # Track API timing
+        api_start = time.perf_counter()
+        response = self._http_get(page_url, headers=headers, timeout=self.config.list_timeout)
+        api_elapsed = time.perf_counter() - api_start
+        self.metrics.record_api_call(api_elapsed)
+        return response, api_elapsed
+
+    @staticmethod
+    def _prefetch_failed(future: Future) -> bool:
+        """
+        Tells whether a finished list prefetch failed after its retry budget.
+
+        Args:
+            future: Future returned by submitting _fetch_page
+
+        Returns:
+            True for a connection error or a final HTTP 429/5xx response
+        """
+        if not future.done() or future.cancelled():
+            return False
+        error = future.exception()
+        if error is not None:
+            return isinstance(error, requests.exceptions.RequestException)
+        status = future.result()[0].status_code
+        return status == 429 or status >= 500
+
+    def _update_density(self, count: int, span: int) -> None:
+        """
+        Updates the smoothed records-per-second estimate with an observed page.
+
+        Args:
+            count: Number of records returned for the range
+            span: Length of the queried range in seconds
+        """
+        if span <= 0:
+            return
+        density = count / span
+        if self._density_ewma is None:
+            self._density_ewma = density
+        else:
+            alpha = self.DENSITY_EWMA_ALPHA
+            self._density_ewma = alpha * density + (1 - alpha) * self._density_ewma
+
+    def _estimate_split_point(self, start: int, end: int, count: int) -> int:
+        """
+        Picks where to split a range whose page came back full.
+
+        Instead of always bisecting, the first sub-range is sized so that it is
+        expected to hold about half a page at the observed record density,
+        which avoids repeated full-page requests on bursty traffic. A full page
+        only gives a lower bound for the density, so the smoothed estimate is
+        never used below that bound, and the first sub-range is never longer
+        than half the range (the estimate is never worse than bisection).
+
+        Args:
+            start: Range start (Unix timestamp)
+            end: Range end (Unix timestamp)
+            count: Number of records returned for the full page
+
+        Returns:
+            Split timestamp strictly between start and end
+        """
+        span = end - start
+        self._update_density(count, span)
+        # The smoothed estimate lags when traffic ramps up; this page's own
+        # lower bound keeps a stale estimate from shaving off only a few seconds
+        density = max(self._density_ewma or 0.0, count / span)
+        if not density:
+            return (start + end) // 2
+        target_span = int(self.config.max_records_per_page * 0.5 / density)
+        return start + min(max(target_span, 1), span // 2)
+
     # pylint: disable=too-many-arguments,too-many-locals
     # pylint: disable=too-many-branches,too-many-statements,too-many-nested-blocks
-    def retrieve_logs(self, starttime: int, endtime: int, *, retries: Optional[int] = None,
-                      sleep_time: Optional[int] = None, chunk_size: int = 500) -> int:
+    def retrieve_logs(self, starttime: int, endtime: int, *, chunk_size: int = 500) -> int:
         """
         Retrieves mail logs from API within specified time range.
 
         Handles API-imposed page limits by iteratively splitting the time range
-        if a request returns the maximum batch size (e.g., 1000). Implements
-        exponential backoff for transient failures.
+        if a request returns the maximum batch size (e.g., 1000). Transient
+        failures are retried with exponential backoff by the session adapter.
 
         Args:
             starttime: Start time for log retrieval (Unix timestamp)
             endtime: End time for log retrieval (Unix timestamp)
-            retries: Maximum number of retry attempts
-            sleep_time: Seconds to wait between retries
             chunk_size: Number of logs to process before writing to disk
 
         Returns:
             Total number of logs processed
 
         Raises:
-            requests.exceptions.RequestException: If API request fails
+            RuntimeError: If API request still fails after all retries
             ValueError: If response JSON is invalid
         """
-        effective_start = self.load_last_position() or starttime
+        # Bind hot-loop lookups to locals once instead of per interval / sub-batch
+        cfg = self.config
+        max_page = cfg.max_records_per_page
+        api_cat = cfg.api_category
+        max_par = cfg.max_parallel_details
+        extract_item_time = self._extract_item_time
+
+        # The resume point is applied by the caller (split_and_retrieve_logs);
+        # the requested range is fetched as given
+        effective_start = starttime
         # Quarantine search limit: Using 6 days (instead of 7) for a safety margin.
         # Reference: HTTP 406 message "Can make search 7 days before at most"
         max_q_limit = 6 * 24 * 3600
         is_quarantine = (
-            self.config.log_type == 'quarantine' or
-            self.config.api_category == 'quarantine'
+            cfg.log_type == 'quarantine' or
+            api_cat == 'quarantine'
         )
         if is_quarantine:
             # Retention limit: API only allows data from the last 7 days.
@@ -617,273 +1569,278 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         buffer: List[Dict[str, Any]] = []
         total_processed = 0
         last_processed_time = effective_start
-
-        retries = retries or self.config.list_retries
-        sleep_time = sleep_time or self.config.list_sleep_time
+        # Next range's list request, started while the current page is processed
+        prefetched: Optional[Tuple[Tuple[int, int], Future]] = None
 
         while intervals:
             # Check for shutdown request
-            if self._shutdown_requested:
+            if MailLogger._shutdown_flag:
                 self.log_message("Shutdown requested, saving position and exiting...")
                 if buffer:
                     self.process_logs(buffer)
-                self.save_last_position(last_processed_time)
+                self.save_last_position(last_processed_time, force=True)
                 break
 
-            s, e = intervals.pop()
-            count_all = 0 # Track if we successfully got data for this interval
-
-            # Category-specific parameters
-            params = {
-                'starttime': s,
-                'endtime': e,
-            }
-            # Only include 'type' for categories that use it (mail, quarantine)
-            if self.config.api_category != 'authentication':
-                params['type'] = self.config.log_type
-            if self.config.domain:
-                params['domain'] = self.config.domain
-
-            self.log_message(
-                f"Retrieving logs for category '{self.config.api_category}' with params: {params}")
+            range_start, range_end = intervals.pop()
+            page_url, cache_key, request_headers = self._build_page_request(range_start, range_end)
+
+            self.log_message(f"Retrieving logs for category '{api_cat}': {page_url}")
+
+            # Use the prefetched response if it was started for this exact range.
+            # A prefetch that already failed after its retry budget is surfaced
+            # (result() re-raises it below) instead of spending a second cycle
+            page_future = None
+            if prefetched is not None:
+                prefetch_range, prefetch_future = prefetched
+                prefetched = None
+                if (prefetch_range == (range_start, range_end)
+                        or self._prefetch_failed(prefetch_future)):
+                    page_future = prefetch_future
+                else:
+                    prefetch_future.cancel()
 
-            attempt = 0
+            # Transient failures (HTTP 429/5xx, connection errors) are retried with
+            # backoff by the session's urllib3 Retry policy. Reaching an except arm
+            # below means that retry budget is already exhausted.
             is_successful = False
-            while attempt < retries:
-                if self._shutdown_requested:
-                    break
+            page_etag = None
+            api_elapsed = None
+            try:
+                if page_future is not None:
+                    response, api_elapsed = page_future.result()
+                else:
+                    response, api_elapsed = self._fetch_page(page_url, request_headers)
 
-                try:
+                response.raise_for_status()
+                not_modified = response.status_code == 304
+                if not_modified:
                     self.log_message(
-                        f"Attempt {attempt + 1} to retrieve mail logs for range [{s}, {e}]")
-
-                    # Track API timing
-                    api_start = time.perf_counter()
-                    # Use session if enabled, otherwise direct request with headers
-                    if self.session:
-                        response = self.session.get(
-                            self.config.url, params=params, timeout=self.config.list_timeout)
-                    else:
-                        response = requests.get(
-                            self.config.url, headers=self.auth_headers, params=params,
-                            timeout=self.config.list_timeout)
-                    api_elapsed = time.perf_counter() - api_start
-                    self.metrics.record_api_call(api_elapsed)
-
-                    response.raise_for_status()
+                        f"Range [{range_start}, {range_end}] not modified (ETag match), skipping")
+                    data = []
+                else:
                     try:
-                        data = response.json()
+                        # Decode raw bytes directly, skipping requests' charset detection
+                        data = _json_loads(response.content)
                     except ValueError:
                         self.log_error(
                             f"JSON decode error: {response.text}", request_info=response.url)
                         raise
-                    count_all = len(data)
-                    self.log_message(f"Retrieved {count_all} logs for range [{s}, {e}]")
-
-                    # If page is full, split the interval iteratively
-                    if count_all >= self.config.max_records_per_page and e - s > 1:
-                        mid = (s + e) // 2
-                        self.log_message(
-                            f"Max page size reached; splitting into [{s}, {mid}] and [{mid}, {e}]")
-                        intervals.append((mid, e))
-                        intervals.append((s, mid))
-                        break  # move to next interval from stack
-
-                    total_jobs_in_page = 0
-                    # List of (type, data) where type is 'log' or 'job' (with index)
-                    processing_sequence = []
-                    job_details = [] # List of (queue_id, time)
-
-                    # Prepare sequence in chronological order
-                    if self.config.api_category == 'mail':
-                        for item in reversed(data):
-                            queue_id = item.get('queue_id')
-                            recipients = item.get('recipients', [])
-
-                            if queue_id and recipients:
-                                recipient = recipients[0]
-                                queue_id_time = recipient.get('time')
-                                if queue_id_time:
-                                    processing_sequence.append(('job', len(job_details)))
-                                    # Store original item as fallback
-                                    job_details.append({
-                                        'queue_id': queue_id,
-                                        'time': queue_id_time,
-                                        'original': item
-                                    })
-                                    total_jobs_in_page += 1
-                                    continue
-
-                            processing_sequence.append(('log', item))
-                    else:
-                        # Quarantine / Authentication
-                        for item in reversed(data):
-                            processing_sequence.append(('log', item))
-
-                    # Process jobs in parallel chunks
-                    if job_details:
-                        self.log_message(
-                            f"Processing {total_jobs_in_page} detailed logs in parallel chunks...")
-                        sub_batch_size = max(self.config.max_parallel_details * 5, 50)
-
-                        for i in range(0, total_jobs_in_page, sub_batch_size):
-                            if self._shutdown_requested:
-                                break
-
-                            chunk_indices = range(i, min(i + sub_batch_size, total_jobs_in_page))
-                            chunk_details = [job_details[idx] for idx in chunk_indices]
-
-                            with ThreadPoolExecutor(
-                                    max_workers=self.config.max_parallel_details
-                            ) as thread_executor:
-                                # Create futures mapped to their queue_ids
-                                futures_with_ids = [
-                                    (thread_executor.submit(self.retrieve_detailed_log, d['queue_id'], d['time']), d['queue_id'])
-                                    for d in chunk_details
-                                ]
-
-                                batch_results = []
-                                for batch_future, qid in futures_with_ids:
-                                    try:
-                                        batch_results.append(batch_future.result())
-                                    except Exception as e:
-                                        self.log_error(
-                                            f"Failed to retrieve detailed log for queue_id {qid} (summary fallback): {e}")
-                                        self.metrics.errors_count += 1
-                                        batch_results.append(None)
-
-                                # Update job_details with actual log data or fallback
-                                for idx_in_chunk, result_log in enumerate(batch_results):
-                                    actual_idx = chunk_indices[idx_in_chunk]
-                                    if result_log:
-                                        job_details[actual_idx] = result_log
-                                    else:
-                                        # Use stored original summary log as fallback
-                                        job_details[actual_idx] = job_details[actual_idx]['original']
-
-                            # Update progress
-                            current_completed = min(i + sub_batch_size, total_jobs_in_page)
-                            percent = (current_completed / total_jobs_in_page) * 100
+                    if cache_key:
+                        page_etag = response.headers.get('ETag')
+                # Release the raw body as soon as it is decoded so the page isn't
+                # held in memory twice (bytes + parsed records) while it is processed
+                response = None
+                count_all = len(data)
+                self.log_message(
+                    f"Retrieved {count_all} logs for range [{range_start}, {range_end}]")
+
+                # If page is full, split the interval iteratively
+                if count_all >= max_page and range_end - range_start > 1:
+                    mid = self._estimate_split_point(range_start, range_end, count_all)
+                    self._page_splits += 1
+                    self.log_message(
+                        f"Max page size reached; splitting into "
+                        f"[{range_start}, {mid}] and [{mid}, {range_end}]")
+                    intervals.append((mid, range_end))
+                    intervals.append((range_start, mid))
+                    continue  # move to next interval from stack
+
+                if not not_modified:
+                    self._update_density(count_all, range_end - range_start)
+
+                # This page won't be split, so the next range is final: fetch it
+                # in the background while this page's details are fetched and written
+                if intervals and not MailLogger._shutdown_flag:
+                    next_range = intervals[-1]
+                    next_url, _, next_headers = self._build_page_request(*next_range)
+                    prefetched = (next_range, self._page_pool.submit(
+                        self._fetch_page, next_url, next_headers))
+
+                # Page layout as parallel arrays (no per-record tuples):
+                # sequence_tags[n] is 0 if sequence_items[n] is a record, or 1 if it
+                # is an index into the job_* arrays
+                sequence_tags = array('b')
+                sequence_items: List[Any] = []
+                job_ids: List[str] = []
+                job_times: List[int] = []
+                # Summary record per job, replaced by the detailed log once fetched
+                job_logs: List[Dict[str, Any]] = []
+
+                # Prepare sequence in chronological order
+                if api_cat == 'mail':
+                    for item in reversed(data):
+                        queue_id = item.get('queue_id')
+                        recipients = item.get('recipients')
+                        queue_id_time = (
+                            recipients[0].get('time') if queue_id and recipients else None)
+
+                        if queue_id_time:
+                            sequence_tags.append(1)
+                            sequence_items.append(len(job_ids))
+                            job_ids.append(queue_id)
+                            job_times.append(queue_id_time)
+                            job_logs.append(item)
+                        else:
+                            sequence_tags.append(0)
+                            sequence_items.append(item)
+                else:
+                    # Quarantine / Authentication (reverse in place, no copy)
+                    data.reverse()
+                    sequence_items = data
+                    sequence_tags = array('b', bytes(len(sequence_items)))
+                # Drop the page list; summaries of jobs now live only in job_logs and are
+                # freed as soon as their detailed log replaces them
+                del data
+
+                total_jobs_in_page = len(job_ids)
+
+                # Process jobs in parallel chunks
+                if job_ids:
+                    self.log_message(
+                        f"Processing {total_jobs_in_page} detailed logs in parallel chunks...")
+                    sub_batch_size = max(max_par * 5, 50)
+                    last_progress_step = 0
+                    last_progress_log = time.monotonic()
+
+                    for i in range(0, total_jobs_in_page, sub_batch_size):
+                        if MailLogger._shutdown_flag:
+                            break
+
+                        chunk_indices = range(i, min(i + sub_batch_size, total_jobs_in_page))
+
+                        # Submit to the persistent pool; map each future to its job index
+                        future_to_idx = {
+                            self._detail_pool.submit(
+                                self.retrieve_detailed_log, job_ids[idx], job_times[idx]): idx
+                            for idx in chunk_indices
+                        }
+
+                        # Collect in completion order so slow requests don't block the rest
+                        for detail_future in as_completed(future_to_idx):
+                            actual_idx = future_to_idx[detail_future]
+                            try:
+                                result_log = detail_future.result()
+                            except RetryAbortedError:
+                                # Shutdown: this page is not written, nothing to log
+                                result_log = None
+                            except Exception as detail_exc: # pylint: disable=broad-exception-caught
+                                self.log_error(
+                                    f"Failed to retrieve detailed log for queue_id "
+                                    f"{job_ids[actual_idx]} (summary fallback): {detail_exc}")
+                                self.metrics.errors_count += 1
+                                result_log = None
+
+                            # Keep the stored summary log as fallback
+                            if result_log:
+                                job_logs[actual_idx] = result_log
+
+                        # Update progress: log every PROGRESS_LOG_STEP percent, when a
+                        # slow page has been quiet for PROGRESS_LOG_INTERVAL, or at the end
+                        current_completed = min(i + sub_batch_size, total_jobs_in_page)
+                        percent = current_completed * 100 // total_jobs_in_page
+                        progress_step = percent // self.PROGRESS_LOG_STEP
+                        now_mono = time.monotonic()
+                        if (progress_step > last_progress_step
+                                or now_mono - last_progress_log >= self.PROGRESS_LOG_INTERVAL
+                                or current_completed == total_jobs_in_page):
+                            last_progress_step = progress_step
+                            last_progress_log = now_mono
                             self.log_message(
                                 f"Progress: {current_completed}/{total_jobs_in_page} "
-                                f"({percent:.1f}%)")
-                            # Short interruptible breather
-                            MailLogger._shutdown_event.wait(0.01)
-
-                    # Now process FULL sequence in order
-                    if not self._shutdown_requested:
-                        for item_type, content in processing_sequence:
-                            if item_type == 'job':
-                                item = job_details[content]
-                            else:
-                                item = content
-
-                            if not item:
-                                continue
-
-                            # Extract timestamp for position update
-                            item_time = None
-                            if self.config.api_category == 'mail':
-                                # Mail log structure
-                                recipients = item.get('recipients', [])
-                                if recipients:
-                                    item_time = recipients[0].get('time')
-                                elif 'time' in item:
-                                    item_time = item.get('time')
-                            else:
-                                # Use timestamp or time for Quarantine/Auth
-                                item_time = item.get('time') or item.get(
-                                    'timestamp') or item.get('starttime')
+                                f"({percent}%)")
+
+                # Now process FULL sequence in order
+                if not MailLogger._shutdown_flag:
+                    # Resolve job slots to their (detailed or summary) record in one
+                    # pass, so the drain loop below doesn't branch on the tag
+                    if job_logs:
+                        page_items = [
+                            job_logs[content] if is_job else content
+                            for is_job, content in zip(sequence_tags, sequence_items)
+                        ]
+                    else:
+                        page_items = sequence_items
 
-                            if item_time:
-                                last_processed_time = item_time
+                    for item in page_items:
+                        if not item:
+                            continue
+
+                        # Extract timestamp for position update
+                        item_time = extract_item_time(item)
+                        if item_time:
+                            last_processed_time = item_time
 
-                            buffer.append(item)
-                            total_processed += 1
-                            self.metrics.logs_processed += 1
+                        buffer.append(item)
+                        total_processed += 1
+                        self.metrics.logs_processed += 1
 
-                            # Periodically write buffer to disk
-                            if len(buffer) >= chunk_size:
-                                self.process_logs(buffer)
-                                self.save_last_position(last_processed_time)
-                                buffer.clear()
+                        # Periodically write buffer to disk
+                        if len(buffer) >= chunk_size:
+                            self.process_logs(buffer)
+                            self.save_last_position(last_processed_time)
+                            buffer.clear()
 
                     # Finished this page successfully
                     is_successful = True
-                    break
-
-                except requests.exceptions.HTTPError as http_error:
-                    attempt += 1
-                    self.metrics.errors_count += 1
-                    detailed_error = self._parse_api_error(http_error.response)
-                    url_with_params = (
-                        http_error.response.url if http_error.response is not None
-                        else self.config.url
-                    )
-                    duration_ms = round(api_elapsed * 1000, 2) if 'api_elapsed' in dir() else None
-
-                    # HTTP 429 Rate Limit handling
-                    if http_error.response is not None and http_error.response.status_code == 429:
-                        retry_after = http_error.response.headers.get('Retry-After')
-                        if retry_after:
-                            try:
-                                wait_seconds = int(retry_after)
-                            except ValueError:
-                                wait_seconds = 60
-                            self.log_error(
-                                f"Rate Limited (HTTP 429) for {url_with_params}. "
-                                f"Retry-After: {retry_after}s (attempt {attempt})",
-                                request_info=url_with_params, duration_ms=duration_ms
-                            )
-                            if attempt < retries:
-                                MailLogger._shutdown_event.wait(wait_seconds)
-                            continue
 
-                        self.log_error(
-                            f"Rate Limited (HTTP 429) for {url_with_params}. "
-                            f"No Retry-After header (attempt {attempt})",
-                            request_info=url_with_params, duration_ms=duration_ms
-                        )
-                        if attempt < retries:
-                            delay = min(sleep_time * (2 ** (attempt - 1)), 60)
-                            MailLogger._shutdown_event.wait(delay)
-                        continue
+            except RetryAbortedError:
+                # Shutdown arrived during a retry wait: stop like the check above
+                self.log_message("Shutdown requested, saving position and exiting...")
+                if buffer:
+                    self.process_logs(buffer)
+                    buffer.clear()
+                self.save_last_position(last_processed_time, force=True)
+                break
+            except requests.exceptions.HTTPError as http_error:
+                self.metrics.errors_count += 1
+                detailed_error = self._parse_api_error(http_error.response)
+                url_with_params = (
+                    http_error.response.url if http_error.response is not None
+                    else page_url
+                )
+                duration_ms = round(api_elapsed * 1000, 2) if api_elapsed is not None else None
 
+                if http_error.response is not None and http_error.response.status_code == 429:
                     self.log_error(
-                        f"API HTTP Error for URL {url_with_params} (attempt {attempt}): "
-                        f"{detailed_error}",
+                        f"Rate Limited (HTTP 429) for {url_with_params} after "
+                        f"{cfg.list_retries} retries",
                         request_info=url_with_params, duration_ms=duration_ms
                     )
-                    if attempt < retries:
-                        delay = min(sleep_time * (2 ** (attempt - 1)), 60)
-                        MailLogger._shutdown_event.wait(delay)
-                except requests.exceptions.RequestException as req_error:
-                    attempt += 1
-                    self.metrics.errors_count += 1
-                    failed_url = getattr(
-                        req_error.request, 'url', self.config.url) if hasattr(
-                        req_error, 'request') else self.config.url
-                    duration_ms = round(api_elapsed * 1000, 2) if 'api_elapsed' in dir() else None
-
-                    # Classify the connection error
-                    error_label = self._classify_connection_error(req_error, failed_url)
+                else:
                     self.log_error(
-                        f"{error_label} for {failed_url} (attempt {attempt}): {req_error}",
-                        request_info=failed_url, duration_ms=duration_ms
+                        f"API HTTP Error for URL {url_with_params} after "
+                        f"{cfg.list_retries} retries: {detailed_error}",
+                        request_info=url_with_params, duration_ms=duration_ms
                     )
-
-                    if attempt < retries:
-                        delay = min(sleep_time * (2 ** (attempt - 1)), 60)
-                        MailLogger._shutdown_event.wait(delay)
-                except ValueError:
-                    raise
-                except Exception as unexpected_error: # pylint: disable=broad-exception-caught
-                    self.log_error(
-                        f"Unexpected error: {unexpected_error}", request_info=self.config.url)
-                    self.save_last_position(last_processed_time)
-                    buffer.clear()
-                    self.metrics.errors_count += 1
-                    raise
+                raise RuntimeError(
+                    f"Failed to retrieve logs for range [{range_start}, {range_end}] after "
+                    f"{cfg.list_retries} retries.") from http_error
+            except requests.exceptions.RequestException as req_error:
+                self.metrics.errors_count += 1
+                failed_url = getattr(
+                    req_error.request, 'url', cfg.url) if hasattr(
+                    req_error, 'request') else cfg.url
+                duration_ms = round(api_elapsed * 1000, 2) if api_elapsed is not None else None
+
+                # Classify the connection error
+                error_label = self._classify_connection_error(req_error, failed_url)
+                self.log_error(
+                    f"{error_label} for {failed_url} after {cfg.list_retries} "
+                    f"retries: {req_error}",
+                    request_info=failed_url, duration_ms=duration_ms
+                )
+                raise RuntimeError(
+                    f"Failed to retrieve logs for range [{range_start}, {range_end}] after "
+                    f"{cfg.list_retries} retries.") from req_error
+            except ValueError:
+                raise
+            except Exception as unexpected_error: # pylint: disable=broad-exception-caught
+                self.log_error(
+                    f"Unexpected error: {unexpected_error}", request_info=cfg.url)
+                self.save_last_position(last_processed_time, force=True)
+                buffer.clear()
+                self.metrics.errors_count += 1
+                raise
 
             if is_successful:
                 # Finished a page or interval portion successfully
@@ -891,136 +1848,95 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
                     self.process_logs(buffer)
                     buffer.clear()
                 # Update position to the end of this successful interval/page
-                last_processed_time = e
-                self.save_last_position(last_processed_time)
-            elif not self._shutdown_requested and count_all < self.config.max_records_per_page:
-                # If we didn't succeed and it wasn't a split, raise
-                raise RuntimeError(
-                    f"Failed to retrieve logs for range [{s}, {e}] after {retries} attempts.")
+                last_processed_time = range_end
+                self.save_last_position(last_processed_time, force=True)
+                if page_etag:
+                    self._store_etag(cache_key, page_etag)
 
         # Döngü bittikten sonra kalan buffer'ı da yaz
         if buffer:
             self.process_logs(buffer)
             buffer.clear()
 
-        self.save_last_position(last_processed_time)  # Final checkpoint
+        self.save_last_position(last_processed_time, force=True)  # Final checkpoint
 
         self.log_message(
-            f"Finished retrieving {self.config.api_category} logs, "
+            f"Finished retrieving {api_cat} logs, "
             f"processed {total_processed} items"
         )
         return total_processed
 
-    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
-    def retrieve_detailed_log(
-            self, queue_id: str, event_time: int, *,
-            retries: Optional[int] = None, sleep_time: Optional[int] = None) -> Dict[str, Any]:
+    def retrieve_detailed_log(self, queue_id: str, event_time: int) -> Dict[str, Any]:
         """
         Retrieves detailed log information for specific mail event.
 
-        Fetches extended information for a mail event and removes unnecessary fields.
+        Transient failures are retried by the session adapter using the
+        configured detail_retries and detail_sleep_time.
 
         Args:
             queue_id: Unique identifier for mail queue
             event_time: Event timestamp
-            retries: Maximum number of retry attempts
-            sleep_time: Seconds to wait between retries
 
         Returns:
-            Detailed log information with unnecessary fields removed
+            Detailed log information
 
         Raises:
-            Exception: If retrieval fails after maximum retries
+            Exception: If retrieval still fails after all retries
         """
-        retries = retries or self.config.detail_retries
-        sleep_time = sleep_time or self.config.detail_sleep_time
         detailed_log_url = f'{self.config.url}/{queue_id}?time={event_time}'
-        attempt = 0
-        while attempt < retries:
-            try:
+        api_elapsed = None
+        try:
+            if self._collect_metrics:
                 # Track API timing
                 api_start = time.perf_counter()
-                if self.session:
-                    response = self.session.get(
-                        detailed_log_url, timeout=self.config.detail_timeout)
-                else:
-                    response = requests.get(
-                        detailed_log_url, headers=self.auth_headers,
-                        timeout=self.config.detail_timeout)
+                response = self._http_get(detailed_log_url, timeout=self.config.detail_timeout)
                 api_elapsed = time.perf_counter() - api_start
                 self.metrics.record_api_call(api_elapsed)
+            else:
+                response = self._http_get(detailed_log_url, timeout=self.config.detail_timeout)
 
-                response.raise_for_status()
-                try:
-                    detailed_log = response.json()
-                except ValueError:
-                    self.log_error(f"JSON decode error: {response.text}", request_info=response.url)
-                    raise
-                # Successful retrieval
-                return detailed_log
-
-            except requests.exceptions.HTTPError as http_error:
-                attempt += 1
-                detailed_error = self._parse_api_error(http_error.response)
-                url_with_params = (
-                    http_error.response.url if http_error.response is not None
-                    else detailed_log_url
-                )
-                duration_ms = round(api_elapsed * 1000, 2) if 'api_elapsed' in dir() else None
-
-                # HTTP 429 Rate Limit handling
-                if http_error.response is not None and http_error.response.status_code == 429:
-                    retry_after = http_error.response.headers.get('Retry-After')
-                    if retry_after:
-                        try:
-                            wait_seconds = int(retry_after)
-                        except ValueError:
-                            wait_seconds = 60
-                        self.log_error(
-                            f"Rate Limited (HTTP 429) for {url_with_params}. "
-                            f"Retry-After: {retry_after}s (attempt {attempt})",
-                            request_info=url_with_params, duration_ms=duration_ms
-                        )
-                        if attempt < retries:
-                            MailLogger._shutdown_event.wait(wait_seconds)
-                        else:
-                            raise
-                        continue
-
-                if attempt < retries:
-                    MailLogger._shutdown_event.wait(sleep_time)
-                else:
-                    self.log_error(
-                        f"API HTTP Error for URL {url_with_params} after {retries} "
-                        f"attempts: {detailed_error}",
-                        request_info=url_with_params, duration_ms=duration_ms
-                    )
-                    raise
-            except Exception as detail_error: # pylint: disable=broad-exception-caught
-                attempt += 1
-                duration_ms = round(api_elapsed * 1000, 2) if 'api_elapsed' in dir() else None
-                if attempt < retries:
-                    MailLogger._shutdown_event.wait(sleep_time)
-                else:
-                    # Classify connection errors
-                    if isinstance(detail_error, requests.exceptions.RequestException):
-                        # Classify the connection error
-                        error_label = self._classify_connection_error(
-                            detail_error, detailed_log_url)
-                        self.log_error(
-                            f"{error_label} for {detailed_log_url} after {retries} "
-                            f"attempts: {detail_error}",
-                            request_info=detailed_log_url, duration_ms=duration_ms
-                        )
-                    else:
-                        self.log_error(
-                            f"Failed to retrieve detailed log from {detailed_log_url} "
-                            f"after {retries} attempts: {detail_error}",
-                            request_info=detailed_log_url, duration_ms=duration_ms
-                        )
-                    raise
-        # This point should be unreachable given the raise/return structure above
-        raise RuntimeError(f"Failed to retrieve detailed log from {detailed_log_url}")
+            response.raise_for_status()
+            try:
+                detailed_log = _json_loads(response.content)
+            except ValueError:
+                self.log_error(f"JSON decode error: {response.text}", request_info=response.url)
+                raise
+            # Successful retrieval
+            return detailed_log
+
+        except requests.exceptions.HTTPError as http_error:
+            detailed_error = self._parse_api_error(http_error.response)
+            url_with_params = (
+                http_error.response.url if http_error.response is not None
+                else detailed_log_url
+            )
+            duration_ms = round(api_elapsed * 1000, 2) if api_elapsed is not None else None
+            self.log_error(
+                f"API HTTP Error for URL {url_with_params} after "
+                f"{self.config.detail_retries} retries: {detailed_error}",
+                request_info=url_with_params, duration_ms=duration_ms
+            )
+            raise
+        except requests.exceptions.RequestException as detail_error:
+            duration_ms = round(api_elapsed * 1000, 2) if api_elapsed is not None else None
+            # Classify the connection error
+            error_label = self._classify_connection_error(detail_error, detailed_log_url)
+            self.log_error(
+                f"{error_label} for {detailed_log_url} after {self.config.detail_retries} "
+                f"retries: {detail_error}",
+                request_info=detailed_log_url, duration_ms=duration_ms
+            )
+            raise
+        except RetryAbortedError:
+            # Shutdown, not a failed lookup
+            raise
+        except Exception as detail_error: # pylint: disable=broad-exception-caught
+            duration_ms = round(api_elapsed * 1000, 2) if api_elapsed is not None else None
+            self.log_error(
+                f"Failed to retrieve detailed log from {detailed_log_url}: {detail_error}",
+                request_info=detailed_log_url, duration_ms=duration_ms
+            )
+            raise
 
     def _mask_api_key(self, api_key: str) -> str:
         """
@@ -1040,6 +1956,10 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         """
         Verifies if the hostname in the URL can be resolved.
 
+        Results are cached per hostname for `DNS_CHECK_TTL` seconds, so a burst
+        of connection errors during an outage costs a single (possibly slow)
+        resolver lookup.
+
         Args:
             url: The URL to check
 
@@ -1048,14 +1968,25 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         """
         try:
             hostname = urlparse(url).hostname
-            if hostname:
-                socket.gethostbyname(hostname)
-                return True
+        except Exception: # pylint: disable=broad-exception-caught
+            return True
+        if not hostname:
+            return True
+
+        now = time.monotonic()
+        cached = self._dns_cache.get(hostname)
+        if cached is not None and now - cached[0] < self.DNS_CHECK_TTL:
+            return cached[1]
+
+        try:
+            socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+            resolved = True
         except socket.gaierror:
-            return False
+            resolved = False
         except Exception: # pylint: disable=broad-exception-caught
             return True
-        return True
+        self._dns_cache[hostname] = (now, resolved)
+        return resolved
 
     def _classify_connection_error(self, error: Exception, url: str) -> str:
         """
@@ -1068,17 +1999,16 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         Returns:
             A descriptive error label string
         """
-        error_str = str(error).lower()
+        error_str = str(error)
 
         # Check for timeout
         if (isinstance(error, requests.exceptions.Timeout) or
-                'timeout' in error_str or 'timed out' in error_str):
+                _TIMEOUT_PATTERN.search(error_str)):
             return "Connection Timeout"
 
         # Check for connection refused
         if isinstance(error, requests.exceptions.ConnectionError):
-            if ('connection refused' in error_str or '[errno 111]' in error_str or
-                    '[winerror 10061]' in error_str):
+            if _REFUSED_PATTERN.search(error_str):
                 return "Connection Refused"
             # Check for DNS failure
             if not self._check_dns(url):
@@ -1088,11 +2018,47 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
             return "Connection Error"
 
         # Check for SSL errors
-        if 'ssl' in error_str or 'certificate' in error_str:
+        if _SSL_PATTERN.search(error_str):
             return "SSL/TLS Error"
 
         return "Request Error"
 
+    def _resolve_error_log_path(self) -> str:
+        """
+        Resolves the current error log path, reusing it while the name can't change.
+
+        Returns:
+            Timestamped path if the pattern has date tokens, otherwise the fixed
+            per-section errors file
+        """
+        now = time.time()
+        valid_until, cached_path = self._error_path_cache
+        if now < valid_until:
+            return cached_path
+
+        # Use timestamped filename if pattern has date tokens
+        pattern = self.config.error_log_file_name
+        if self._has_date_tokens(pattern):
+            if '%f' in pattern:
+                resolved_filename = datetime.fromtimestamp(now).strftime(pattern)
+                valid_until = 0.0
+            else:
+                local_now = time.localtime(now)
+                resolved_filename = time.strftime(pattern, local_now)
+                valid_until = self._name_valid_until(pattern, now, local_now)
+            if os.path.isabs(resolved_filename):
+                error_log_path = resolved_filename
+            else:
+                error_log_path = os.path.join(self.config.log_directory, resolved_filename)
+        else:
+            suffix = f"_{self.config.section_name}" if self.config.section_name else ""
+            error_log_path = os.path.join(self.config.log_directory, f'errors{suffix}.log')
+            valid_until = float('inf')
+
+        # Single tuple assignment, so concurrent detail workers never see a mixed pair
+        self._error_path_cache = (valid_until, error_log_path)
+        return error_log_path
+
     # pylint: disable=too-many-locals
     def log_error(
             self, error_message: str, request_info: Optional[str] = None,
@@ -1105,46 +2071,112 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
             request_info: Optional request URL or information
             duration_ms: Optional request duration in milliseconds
         """
-        error_data = {
-            "time": int(datetime.now().timestamp()),
-            "error": str(error_message),
-            "api_key": self._mask_api_key(self.config.api_key),
-            "domain": self.config.domain,
-            "type": self.config.log_type
-        }
+        # Only the variable fields are encoded per call; the rest is pre-built
+        error_line = b'{"time":%d,"error":%s%s' % (
+            int(time.time()), _json_dumps(str(error_message)), self._error_static_fields)
         if request_info:
-            error_data["request"] = request_info
+            error_line += b',"request":' + _json_dumps(request_info)
         if duration_ms is not None:
-            error_data["duration_ms"] = duration_ms
-        error_json = json.dumps(error_data, ensure_ascii=False)
+            error_line += b',"duration_ms":' + _json_dumps(duration_ms)
+        error_line += b'}\n'
+
+        error_log_path = self._resolve_error_log_path()
+
+        with self._error_fd_lock:
+            if not self._error_writer_closed:
+                if self._error_writer is None:
+                    self._error_writer = threading.Thread(
+                        target=self._error_writer_loop, daemon=True,
+                        name=f"error-writer-{self.config.section_name}")
+                    self._error_writer.start()
+                # Callers (often retry paths) never wait on disk I/O
+                self._error_queue.put((error_log_path, error_line))
+                return
+            self._write_error_lines(error_log_path, error_line)
 
-        # Use timestamped filename if pattern has date tokens
-        pattern = self.config.error_log_file_name
-        has_date_tokens = any(tok in pattern for tok in ("%Y", "%y", "%m", "%d", "%H", "%M", "%S"))
+    def _write_error_lines(self, error_log_path: str, data: bytes) -> None:
+        """
+        Appends encoded error lines to an error log file (caller holds _error_fd_lock).
 
-        if has_date_tokens:
-            resolved_filename = datetime.now().strftime(pattern)
-            if os.path.isabs(resolved_filename):
-                error_log_path = resolved_filename
-            else:
-                error_log_path = os.path.join(self.config.log_directory, resolved_filename)
-        else:
-            suffix = f"_{self.config.section_name}" if self.config.section_name else ""
-            error_log_path = os.path.join(self.config.log_directory, f'errors{suffix}.log')
+        Falls back to printing to the console if the file can't be written.
 
+        Args:
+            error_log_path: Resolved error log file path
+            data: One or more newline-terminated JSON lines
+        """
         try:
-            error_dir = os.path.dirname(error_log_path)
-            if error_dir and not os.path.exists(error_dir):
-                os.makedirs(error_dir, exist_ok=True)
-
-            with open(error_log_path, 'a', encoding='utf-8') as log_file:
-                log_file.write(error_json + "\n")
+            if self._error_fd is None or self._error_fd_path != error_log_path:
+                self._close_error_fd()
+                error_dir = os.path.dirname(error_log_path)
+                if error_dir:
+                    os.makedirs(error_dir, exist_ok=True)
+                self._error_fd = os.open(
+                    error_log_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0),
+                    0o644)
+                self._error_fd_path = error_log_path
+            # A single O_APPEND write keeps lines intact across processes too
+            os.write(self._error_fd, data)
         except Exception as e: # pylint: disable=broad-exception-caught
             # Fallback to console if file logging fails
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            prefix = f"[{self.config.section_name}] " if self.config.section_name else ""
-            print(f"[{timestamp}] {prefix}CRITICAL: Failed to log error to {error_log_path}: {e}")
-            print(f"[{timestamp}] {prefix}ORIGINAL ERROR: {error_message}")
+            timestamp = _console_timestamp()
+            print(f"[{timestamp}] {self._log_prefix}CRITICAL: "
+                  f"Failed to log error to {error_log_path}: {e}")
+            print(f"[{timestamp}] {self._log_prefix}ORIGINAL ERROR: "
+                  f"{data.decode('utf-8', 'replace').rstrip()}")
+
+    def _error_writer_loop(self) -> None:
+        """
+        Background writer: appends queued error lines until the None sentinel.
+
+        Lines that queued up while a write was in progress are coalesced into
+        one write per file. The error log file is closed by this thread on
+        exit, so close() never closes it while a write may still follow.
+        """
+        error_queue = self._error_queue
+        stop = False
+        while not stop:
+            batch = [error_queue.get()]
+            while True:
+                try:
+                    batch.append(error_queue.get_nowait())
+                except queue.Empty:
+                    break
+            pending_path: Optional[str] = None
+            pending: List[bytes] = []
+            for item in batch:
+                if item is None:
+                    stop = True
+                    break
+                path, line = item
+                if path != pending_path and pending:
+                    with self._error_fd_lock:
+                        self._write_error_lines(pending_path, b"".join(pending))
+                    pending = []
+                pending_path = path
+                pending.append(line)
+            if pending:
+                with self._error_fd_lock:
+                    self._write_error_lines(pending_path, b"".join(pending))
+        with self._error_fd_lock:
+            self._close_error_fd()
+
+    def _stop_error_writer(self) -> bool:
+        """
+        Flushes queued error lines and stops the background writer.
+
+        Returns:
+            False if the writer is still running after the join timeout (it
+            then closes the error log file itself once it drains the queue)
+        """
+        with self._error_fd_lock:
+            writer = self._error_writer
+            self._error_writer_closed = True
+        if writer is None:
+            return True
+        self._error_queue.put(None)
+        writer.join(timeout=self.ERROR_WRITER_JOIN_TIMEOUT)
+        return not writer.is_alive()
 
     # pylint: disable=too-many-arguments,too-many-locals
     # pylint: disable=too-many-branches,too-many-statements,too-many-nested-blocks
@@ -1155,30 +2187,28 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         Uses `max_time_gap` as the chunk size for each API request. Updates
         position tracking after each successful interval retrieval.
         """
-        endtime = int(datetime.now().timestamp())  # Get the current time as Unix timestamp
-        self.log_message(
-            f"End time: {endtime} ("
-            f"{datetime.fromtimestamp(endtime).strftime('%Y-%m-%d %H:%M:%S')})")
+        endtime = int(time.time())  # Get the current time as Unix timestamp
+        endtime_str = self._format_timestamp(endtime)
+        self.log_message(f"End time: {endtime} ({endtime_str})")
         last_position = self.load_last_position()
         if last_position is not None:
             start_time = last_position
         else:
             start_time = self.config.start_time
 
-        self.log_message(
-            f"Start time: {start_time} ("
-            f"{datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M:%S')})")
+        start_time_str = self._format_timestamp(start_time)
+        self.log_message(f"Start time: {start_time} ({start_time_str})")
 
         # Enforce 7-day limit for quarantine category
         if self.config.api_category == 'quarantine':
-            seven_days_ago = int(datetime.now().timestamp()) - (7 * 24 * 60 * 60)
+            seven_days_ago = endtime - (7 * 24 * 60 * 60)
             if start_time < seven_days_ago:
+                seven_days_ago_str = self._format_timestamp(seven_days_ago)
                 self.log_message(
                     f"WARNING: Quarantine logs have a 7-day lookback limit. "
-                    f"Clipping start_time from "
-                    f"{datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M:%S')} "
-                    f"to {datetime.fromtimestamp(seven_days_ago).strftime('%Y-%m-%d %H:%M:%S')}")
+                    f"Clipping start_time from {start_time_str} to {seven_days_ago_str}")
                 start_time = seven_days_ago
+                start_time_str = seven_days_ago_str
 
         # Validate: start_time cannot be greater than end_time
         if start_time >= endtime:
@@ -1202,19 +2232,30 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         # split the request into smaller intervals
         if time_diff > chunk_size:
             current_time = start_time
+            # Interval length adapts to traffic (AIMD): busy stretches that fill a
+            # page get shorter intervals instead of repeated full-page splits
+            step = chunk_size
+            min_step = min(self.MIN_INTERVAL_STEP, chunk_size)
+            step_growth = max(int(chunk_size * self.INTERVAL_STEP_GROWTH), 1)
+            low_water = self.config.max_records_per_page * self.INTERVAL_LOW_WATER
             # Split the time range into intervals and fetch logs for each interval
             while current_time < endtime:
                 if self._shutdown_requested:
                     self.log_message("Shutdown requested during interval processing")
                     break
 
-                # Use configured chunk size but never exceed the allowed gap
-                next_time = min(current_time + chunk_size, endtime)
+                # Use the current step but never exceed the allowed gap
+                next_time = min(current_time + step, endtime)
                 self.log_message(
                     f"Fetching {self.config.api_category} logs from {current_time} to {next_time}")
+                splits_before = self._page_splits
                 # Logs are streamed and written inside retrieve_logs
                 processed = self.retrieve_logs(current_time, next_time)
                 total_processed += processed
+                if self._page_splits > splits_before:
+                    step = max(min_step, step // 2)
+                elif processed < low_water and step < chunk_size:
+                    step = min(chunk_size, step + step_growth)
                 self.update_heartbeat()  # Update heartbeat after each interval
                 current_time = next_time  # Update the current time for the next interval
         else:
@@ -1229,8 +2270,7 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         # Özet bilgi
         self.log_message(
             f"Summary: processed {total_processed} logs between "
-            f"{datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M:%S')} and "
-            f"{datetime.fromtimestamp(endtime).strftime('%Y-%m-%d %H:%M:%S')}"
+            f"{start_time_str} and {endtime_str}"
         )
 
     def acquire_lock(self, lock_file_path: str) -> None:
@@ -1246,14 +2286,25 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
             IOError: If another instance is already running
         """
         self.lock_file_path = lock_file_path
-        # Use open() directly because the lock must remain held for the process lifetime
-        self.lock_file = open(  # pylint: disable=consider-using-with
-            self.lock_file_path, 'w', encoding='utf-8')
+        # Open without truncating (a running holder's PID must survive a failed
+        # attempt) and without leaking the descriptor into child processes.
+        # The file object stays open because the lock is held for the process lifetime.
+        lock_fd = os.open(
+            self.lock_file_path, os.O_CREAT | os.O_RDWR | getattr(os, 'O_CLOEXEC', 0), 0o644)
+        self.lock_file = os.fdopen(lock_fd, 'r+', encoding='utf-8')
         try:
             if os.name == 'nt':
                 msvcrt.locking(self.lock_file.fileno(), msvcrt.LK_NBLCK, 1)
             else:
                 fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # Record the holder's PID for stale-lock diagnostics (best effort)
+            try:
+                self.lock_file.seek(0)
+                self.lock_file.truncate()
+                self.lock_file.write(str(os.getpid()))
+                self.lock_file.flush()
+            except OSError:
+                pass
             self.log_message("Lock acquired")
         except IOError:
             self.log_message("Another instance is already running.")
@@ -1280,45 +2331,82 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
                 self.lock_file.close()
                 os.remove(self.lock_file_path)  # Use the stored lock file path
                 # Just print to console, don't log to file
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                prefix = f"[{self.config.section_name}] " if self.config.section_name else ""
-                print(f"[{timestamp}] {prefix}Lock released")
+                print(f"[{_console_timestamp()}] {self._log_prefix}Lock released")
         except Exception as e:
             self.log_error(f"Error releasing lock: {e}", request_info=self.lock_file_path)
             raise
 
+    def _close_log_stream(self) -> None:
+        """Flushes and closes the output log stream if open."""
+        log_fp = getattr(self, '_log_fp', None)
+        if log_fp is not None:
+            try:
+                log_fp.close()
+            except (IOError, OSError) as e:
+                self.log_error(f"Failed to close log file {self._log_fp_path}: {e}")
+            self._log_fp = None
+            self._log_fp_path = None
+
+    def _close_error_fd(self) -> None:
+        """Closes the error log file descriptor if open."""
+        error_fd = getattr(self, '_error_fd', None)
+        if error_fd is not None:
+            try:
+                os.close(error_fd)
+            except OSError:
+                pass
+            self._error_fd = None
+            self._error_fd_path = None
+
+    def _close_position_fd(self) -> None:
+        """Closes the position file descriptor if open."""
+        pos_fd = getattr(self, '_pos_fd', None)
+        if pos_fd is not None:
+            try:
+                os.close(pos_fd)
+            except OSError:
+                pass
+            self._pos_fd = None
+
     def process_logs(self, logs: List[Dict[str, Any]]) -> None:
         """
         Processes and saves retrieved logs to file.
 
-        Configures logging for email data and ensures proper encoding.
+        Records are serialized to UTF-8 JSON lines and written as a single
+        payload through a buffered binary stream, which is flushed before
+        returning so a following position save never gets ahead of the data.
+        If the resolved file name ends in `.gz`, each batch is written as a
+        complete gzip member (gzip readers concatenate members transparently),
+        so everything the position file covers is readable even if the process
+        dies before the file is closed.
 
         Args:
             logs: List of log entries to process
         """
-        log_file_name = self.generate_log_file_name()
-
-        # Email logger configuration - only for email logs
-        # Use instance email_logger to align with log_email()
-        email_logger = self.email_logger
-        # Configure handler for email logs
-        email_handler = logging.FileHandler(log_file_name, encoding='utf-8')
-        email_handler.setFormatter(logging.Formatter('%(message)s'))
-
-        # Remove any existing handlers to prevent duplicate logging
-        for handler in email_logger.handlers[:]:
-            email_logger.removeHandler(handler)
-
-        email_logger.addHandler(email_handler)
-
         # Save only the email logs
-        for item in logs:
-            if isinstance(item, dict):  # Only save email logs
-                email_logger.info(json.dumps(item, ensure_ascii=False))
+        lines = [_json_dumps(item) for item in logs if isinstance(item, dict)]
+        if not lines:
+            # Nothing to write: don't open (or create) the output file
+            return
 
-        # Remove and close the handler after we're done to avoid descriptor leaks
-        email_logger.removeHandler(email_handler)
-        email_handler.close()
+        log_file_name = self.generate_log_file_name()
+
+        # Reopen only when the resolved file name changes (e.g. hourly rotation)
+        if self._log_fp is None or self._log_fp_path != log_file_name:
+            self._close_log_stream()
+            self._log_fp = open(  # pylint: disable=consider-using-with
+                log_file_name, 'ab', buffering=1024 * 1024)
+            self._log_fp_path = log_file_name
+
+        # Trailing empty element yields the final newline without copying the payload again
+        lines.append(b"")
+        payload = b"\n".join(lines)
+        if log_file_name.endswith('.gz'):
+            # One finished member (header, data and trailer) per batch; a stream
+            # kept open across batches only gets its trailer on close()
+            payload = gzip.compress(payload, compresslevel=self.GZIP_COMPRESS_LEVEL)
+        self._log_fp.write(payload)
+        self._log_fp.flush()
 
     def log_metrics_summary(self) -> None:
         """Logs a summary of collected metrics."""
@@ -1330,6 +2418,9 @@ class MailLogger: # pylint: disable=too-many-instance-attributes
         self.log_message(f"  Avg API time: {metrics['avg_api_time_ms']}ms")
         self.log_message(f"  Min API time: {metrics['min_api_time_ms']}ms")
         self.log_message(f"  Max API time: {metrics['max_api_time_ms']}ms")
+        self.log_message(
+            f"  API time p50/p95: {metrics['p50_api_time_ms']}ms / "
+            f"{metrics['p95_api_time_ms']}ms")
         self.log_message(f"  Throughput: {metrics['logs_per_second']} logs/sec")
         self.log_message(f"  Logs per API call: {metrics['avg_logs_per_api_call']}")
         self.log_message(f"  Total elapsed: {metrics['elapsed_time_seconds']}s")
@@ -1361,6 +2452,7 @@ def discover_sections(cfg: configparser.ConfigParser) -> List[str]:
     return [s for s in cfg.sections() if s.startswith('MailLogger:')]
 
 
+@functools.lru_cache(maxsize=256)
 def get_section_suffix(section_name: str) -> str:
     """Extract suffix from section name for file naming."""
     if ':' in section_name:
@@ -1368,18 +2460,91 @@ def get_section_suffix(section_name: str) -> str:
     return 'default'
 
 
+# MailLoggerConfig fields read straight from a section: (option name, type, default)
+_SECTION_OPTIONS: Tuple[Tuple[str, type, Any], ...] = (
+    ('log_file_name_format', str, '{domain}_{type}_%Y-%m-%d_%H.log'),
+    ('split_interval', int, 300),
+    ('max_time_gap', int, 3600),
+    ('verbose', bool, True),
+    ('message_log_file_name', str, 'messages_%Y-%m-%d_%H.log'),
+    ('message_log_retention_count', int, 2),
+    ('list_timeout', int, 300),
+    ('detail_timeout', int, 120),
+    ('list_retries', int, 8),
+    ('list_sleep_time', int, 2),
+    ('detail_retries', int, 8),
+    ('detail_sleep_time', int, 2),
+    ('max_records_per_page', int, 1000),
+    ('max_parallel_details', int, 2),
+    ('use_session', bool, True),
+    ('enable_etag_cache', bool, False),
+    ('collect_metrics', bool, True),
+    ('max_in_flight_requests', int, 16),
+    ('error_log_file_name', str, 'errors_%Y-%m-%d_%H.log'),
+    ('error_log_retention_count', int, 2),
+    ('log_max_bytes', int, 10 * 1024 * 1024),
+)
+
+
+def _coerce_option(raw: Dict[str, str], section_name: str, key: str,
+                   kind: type, default: Any) -> Any:
+    """
+    Reads one option from a section snapshot, converted like ConfigParser would.
+
+    Args:
+        raw: Section snapshot from snapshot_section
+        section_name: Section name (for error messages)
+        key: Option name
+        kind: str, int or bool
+        default: Value used when the option is not set
+
+    Returns:
+        The converted value, or default if the option is missing
+
+    Raises:
+        ValueError: If the value is not a valid int / boolean
+    """
+    value = raw.get(key)
+    if value is None:
+        return default
+    if kind is bool:
+        state = configparser.ConfigParser.BOOLEAN_STATES.get(value.lower())
+        if state is None:
+            raise ValueError(f"Section {section_name}: not a boolean for '{key}': {value}")
+        return state
+    if kind is int:
+        return int(value)
+    return value
+
+
+def snapshot_section(cfg: configparser.ConfigParser, section_name: str) -> Dict[str, str]:
+    """Copy a config section (with inherited DEFAULT values) into a plain dict."""
+    return dict(cfg.items(section_name))
+
+
 # pylint: disable=too-many-locals,too-many-branches,too-many-statements
 def create_config_for_section(
-        cfg: configparser.ConfigParser,
+        raw: Dict[str, str],
         section_name: str) -> Tuple[MailLoggerConfig, str]:
-    """Create MailLoggerConfig from a config section."""
+    """
+    Create MailLoggerConfig from a config section snapshot.
+
+    Args:
+        raw: Option values of the section, as returned by snapshot_section
+        section_name: Name of the section
+
+    Returns:
+        Tuple of (MailLoggerConfig, resolved lock file path)
+    """
     suffix = get_section_suffix(section_name)
 
     # Establish script directory for relative path resolution
     sect_script_dir = os.path.dirname(os.path.abspath(__file__))
 
     # Read values with fallbacks from DEFAULT section
-    api_key = cfg.get(section_name, 'api_key')
+    api_key = raw.get('api_key')
+    if api_key is None:
+        raise configparser.NoOptionError('api_key', section_name)
 
     # Validate: API key cannot be empty
     if not api_key or api_key.strip() == '' or api_key == 'YOUR_API_KEY_HERE':
@@ -1387,9 +2552,9 @@ def create_config_for_section(
             f"Section {section_name}: 'api_key' is required and "
             f"cannot be empty or placeholder.")
 
-    domain = cfg.get(section_name, 'domain', fallback='')
-    log_type = cfg.get(section_name, 'type', fallback='outgoinglog')
-    api_category = cfg.get(section_name, 'category', fallback='mail')
+    domain = raw.get('domain', '')
+    log_type = raw.get('type', 'outgoinglog')
+    api_category = raw.get('category', 'mail')
 
     # Determine URL based on category
     default_urls = {
@@ -1399,23 +2564,14 @@ def create_config_for_section(
     }
 
     # Priority:
-    # 1. Explicitly set in the SECTION itself (ignore DEFAULT)
+    # 1. Set in the section, or inherited from the [DEFAULT] section's 'url'
     # 2. Category-specific default
-    # 3. If category is 'mail' (default), then fallback to [DEFAULT] section's 'url' if any
-
-    url = None
-    # Check if URL is locally defined in this section
-    if cfg.has_section(section_name) and cfg.has_option(section_name, 'url'):
-        url = cfg.get(section_name, 'url')
+    url = raw.get('url')
 
     if not url:
         # Use category default
         url = default_urls.get(api_category, default_urls['mail'])
 
-        # Special case for 'mail' category: allow [DEFAULT] url for backward compatibility
-        if api_category == 'mail' and cfg.has_option('DEFAULT', 'url'):
-            url = cfg.get('DEFAULT', 'url')
-
     # Log resolution detail for diagnostics
     print(
         f"--- CONFIG DEBUG --- Section: {section_name} -> "
@@ -1427,7 +2583,7 @@ def create_config_for_section(
             f"category is 'mail'. Did you forget 'category = quarantine'?")
 
     # Resolve log directory: if relative, make it relative to script_dir
-    raw_log_dir = cfg.get(section_name, 'log_directory', fallback='./output')
+    raw_log_dir = raw.get('log_directory', './output')
     if not os.path.isabs(raw_log_dir):
         base_log_dir = os.path.abspath(os.path.join(sect_script_dir, raw_log_dir))
     else:
@@ -1439,28 +2595,28 @@ def create_config_for_section(
 
     # For authentication category, skip the type subdirectory since it's not applicable
     # For quarantine, skip if type equals category to avoid quarantine/quarantine
-    if api_category == 'authentication':
-        log_directory = os.path.join(base_log_dir, display_domain, api_category)
-    elif api_category == 'quarantine' and log_type == 'quarantine':
-        # Avoid redundant quarantine/quarantine path
+    # mail category always uses type, quarantine with 'hold' type uses subdirectory
+    if api_category == 'authentication' or (
+            api_category == 'quarantine' and log_type == 'quarantine'):
         log_directory = os.path.join(base_log_dir, display_domain, api_category)
     else:
-        # mail category always uses type, quarantine with 'hold' type uses subdirectory
         log_directory = os.path.join(base_log_dir, display_domain, api_category, log_type)
 
-    # Generate stable instance id for this section
-    unique_id_string = f"{api_key}{domain}{log_type}{api_category}{url}"
-    section_hash = hashlib.md5(unique_id_string.encode('utf-8')).hexdigest()[:8]
+    # Stable instance id for this section; only hashed when an "{id}" template uses it
+    section_hash: Optional[str] = None
 
-    # Anchor positions and locks to script directory as well
-    positions_dir = os.path.join(sect_script_dir, 'positions')
-    locks_dir = os.path.join(sect_script_dir, 'locks')
+    def _section_hash() -> str:
+        nonlocal section_hash
+        if section_hash is None:
+            unique_id_string = f"{api_key}{domain}{log_type}{api_category}{url}"
+            section_hash = hashlib.md5(unique_id_string.encode('utf-8')).hexdigest()[:8]
+        return section_hash
 
     # Position file: use config value or auto-generate
-    position_file_config = cfg.get(section_name, 'position_file', fallback=None)
+    position_file_config = raw.get('position_file')
     if position_file_config:
         if "{id}" in position_file_config:
-            res_pos = position_file_config.replace("{id}", section_hash)
+            res_pos = position_file_config.replace("{id}", _section_hash())
         elif "{section}" in position_file_config:
             res_pos = position_file_config.replace("{section}", suffix)
         else:
@@ -1472,28 +2628,30 @@ def create_config_for_section(
         else:
             position_file = res_pos
     else:
-        position_file = os.path.join(positions_dir, f"{suffix}.pos")
+        # Anchor positions to script directory as well
+        position_file = os.path.join(sect_script_dir, 'positions', f"{suffix}.pos")
 
     # Lock file: use config value or auto-generate
-    lock_file_config = cfg.get(section_name, 'lock_file_path', fallback=None)
+    lock_file_config = raw.get('lock_file_path')
     if lock_file_config:
         if "{id}" in lock_file_config:
-            res_lock = lock_file_config.replace("{id}", section_hash)
+            res_lock = lock_file_config.replace("{id}", _section_hash())
         elif "{section}" in lock_file_config:
             res_lock = lock_file_config.replace("{section}", suffix)
         else:
             res_lock = lock_file_config
 
         # Ensure absolute path
-        if not os.access(res_lock, os.F_OK) and not os.path.isabs(res_lock):
+        if not os.path.isabs(res_lock):
             lock_file_path = os.path.abspath(os.path.join(sect_script_dir, res_lock))
         else:
             lock_file_path = res_lock
     else:
-        lock_file_path = os.path.join(locks_dir, f"{suffix}.lock")
+        # Anchor locks to script directory as well
+        lock_file_path = os.path.join(sect_script_dir, 'locks', f"{suffix}.lock")
 
     # Heartbeat file: use config value or auto-generate
-    heartbeat_file_config = cfg.get(section_name, 'heartbeat_file', fallback=None)
+    heartbeat_file_config = raw.get('heartbeat_file')
     if heartbeat_file_config:
         if "{section}" in heartbeat_file_config:
             res_hb = heartbeat_file_config.replace("{section}", suffix)
@@ -1505,54 +2663,40 @@ def create_config_for_section(
         heartbeat_file = f"{suffix}_heartbeat.json"
 
     # Create config dataclass
+    options = {
+        key: _coerce_option(raw, section_name, key, kind, default)
+        for key, kind, default in _SECTION_OPTIONS
+    }
+    start_time = _coerce_option(
+        raw, section_name, 'start_time', int, int(datetime.now().timestamp()) - 60)
     mail_config = MailLoggerConfig(
-        api_key=api_key, log_directory=log_directory, log_file_name_format=cfg.get(
-            section_name, 'log_file_name_format', fallback='{domain}_{type}_%Y-%m-%d_%H.log'),
-        position_file=position_file,
-        start_time=max(
-            0, cfg.getint(
-                section_name, 'start_time', fallback=int(datetime.now().timestamp()) - 60)),
-        domain=domain, url=url, log_type=log_type, api_category=api_category,
-        split_interval=cfg.getint(section_name, 'split_interval', fallback=300),
-        max_time_gap=cfg.getint(section_name, 'max_time_gap', fallback=3600),
-        verbose=cfg.getboolean(section_name, 'verbose', fallback=True),
-        message_log_file_name=cfg.get(
-            section_name, 'message_log_file_name', fallback='messages_%Y-%m-%d_%H.log'),
-        message_log_retention_count=cfg.getint(
-            section_name, 'message_log_retention_count', fallback=2),
-        list_timeout=cfg.getint(section_name, 'list_timeout', fallback=300),
-        detail_timeout=cfg.getint(section_name, 'detail_timeout', fallback=120),
-        list_retries=cfg.getint(section_name, 'list_retries', fallback=10),
-        list_sleep_time=cfg.getint(section_name, 'list_sleep_time', fallback=2),
-        detail_retries=cfg.getint(section_name, 'detail_retries', fallback=10),
-        detail_sleep_time=cfg.getint(section_name, 'detail_sleep_time', fallback=2),
-        max_records_per_page=cfg.getint(
-            section_name, 'max_records_per_page', fallback=1000),
-        heartbeat_file=heartbeat_file, lock_file_path=lock_file_path, section_name=suffix,
-        max_parallel_details=cfg.getint(section_name, 'max_parallel_details', fallback=2),
-        use_session=cfg.getboolean(section_name, 'use_session', fallback=True),
-        error_log_file_name=cfg.get(
-            section_name, 'error_log_file_name', fallback='errors_%Y-%m-%d_%H.log'),
-        error_log_retention_count=cfg.getint(
-            section_name, 'error_log_retention_count', fallback=2),)
+        api_key=api_key, log_directory=log_directory, position_file=position_file,
+        start_time=max(0, start_time), domain=domain, url=url, log_type=log_type,
+        api_category=api_category, heartbeat_file=heartbeat_file,
+        lock_file_path=lock_file_path, section_name=suffix, **options)
 
     return mail_config, lock_file_path
 
 
-def run_section(cfg: configparser.ConfigParser, section_name: str) -> bool:
-    """Run a single section. Returns True if successful, False if skipped/failed."""
+def run_section(section: Dict[str, str], section_name: str) -> bool:
+    """Run a single section snapshot. Returns True if successful, False if skipped/failed."""
     try:
-        mail_config, lock_file_path = create_config_for_section(cfg, section_name)
+        mail_config, lock_file_path = create_config_for_section(section, section_name)
 
         # Ensure directories exist (thread-safe)
         for dir_path in ['./positions', './locks', mail_config.log_directory]:
-            os.makedirs(dir_path, exist_ok=True)
+            _ensure_dir(dir_path)
 
         print(f"[{get_section_suffix(section_name)}] Starting...")
         print(f"[{get_section_suffix(section_name)}] Lock file: {lock_file_path}")
 
         mail_logger = MailLogger(mail_config)
-        mail_logger.acquire_lock(lock_file_path)
+        try:
+            mail_logger.acquire_lock(lock_file_path)
+        except SystemExit:
+            # Still flush anything logged so far (errors are written in the background)
+            mail_logger.close()
+            raise
         try:
             mail_logger.run()
             return True
@@ -1658,6 +2802,11 @@ def main() -> None:
             print("No MailLogger sections found in config.")
             sys.exit(1)
 
+    # Read every section into a plain dict up front; workers only see these
+    # snapshots, never the shared ConfigParser
+    section_snapshots = {
+        section: snapshot_section(cfg_parser, section) for section in sections_to_run}
+
     # Run sections
     results = {'success': 0, 'skipped': 0, 'failed': 0}
 
@@ -1672,7 +2821,7 @@ def main() -> None:
             )
             with ThreadPoolExecutor(max_workers=actual_workers) as executor:
                 future_to_section = {
-                    executor.submit(run_section, cfg_parser, section): section
+                    executor.submit(run_section, section_snapshots[section], section): section
                     for section in sections_to_run
                 }
                 try:
@@ -1689,22 +2838,24 @@ def main() -> None:
                             results['failed'] += 1
                 except KeyboardInterrupt:
                     print("\nMain thread received Ctrl+C, notifying workers...")
-                    MailLogger._shutdown_event.set()  # pylint: disable=protected-access
+                    MailLogger._shutdown_flag = True  # pylint: disable=protected-access
                     # Wait for threads to finish
                     executor.shutdown(wait=True)
         else:
             # Sequential execution
             for section in sections_to_run:
-                if MailLogger._shutdown_event.is_set():  # pylint: disable=protected-access
+                if MailLogger._shutdown_flag:  # pylint: disable=protected-access
                     break
-                is_success = run_section(cfg_parser, section)
+                is_success = run_section(section_snapshots[section], section)
                 if is_success:
                     results['success'] += 1
                 else:
                     results['skipped'] += 1
     except KeyboardInterrupt:
         print("\nShutdown requested via Ctrl+C")
-        MailLogger._shutdown_event.set()  # pylint: disable=protected-access
+        MailLogger._shutdown_flag = True  # pylint: disable=protected-access
+    finally:
+        MailLogger.close_shared_sessions()
 
     # Print summary if multiple sections
     if len(sections_to_run) > 1: